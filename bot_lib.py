@@ -10,7 +10,9 @@ This module contains all stateless functions for the bot's business logic:
 - Utility functions for data processing
 
 Design Principles:
-- All functions are stateless (no global variables)
+- All functions are stateless (no global variables); the only retained
+  state is the opt-in TTL response cache applied via @ttl_cache and the
+  per-thread Event Registry clients reused across queries
 - Each function does one thing well
 - Pure functions where possible
 - Clear input parameters and return values
@@ -19,25 +21,290 @@ Design Principles:
 See agent.md for complete architecture guidelines.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from datetime import date, timedelta
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import Counter, OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import functools
+import hashlib
+import inspect
+import threading
+import asyncio
+import re
+import sys
 import time
 import os
 import io
+import json
+import mmap
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional dependencies: checked at call time so the rest of the module
+# (e.g. filtering and image helpers) stays usable without them
+try:
+    from eventregistry import (
+        ArticleInfoFlags,
+        EventRegistry,
+        QueryArticles,
+        QueryArticlesIter,
+        QueryItems,
+        RequestArticlesInfo,
+        ReturnInfo
+    )
+    EVENTREGISTRY_AVAILABLE = True
+except ImportError:
+    EVENTREGISTRY_AVAILABLE = False
+
+try:
+    from PIL import ExifTags, Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Import BitcoinMiningFilter
 from src.services.filtering import BitcoinMiningFilter
 
+# Event Registry date parameters (YYYY-MM-DD)
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}\Z')
+
+
+# =============================================================================
+# Caching Helpers
+# =============================================================================
+
+def ttl_cache(ttl_seconds: float, max_size: int = 128, ignore: Tuple[str, ...] = ('session',)):
+    """
+    Decorator that memoizes a function's results for a limited time.
+    
+    Repeated calls with the same arguments inside the TTL window are served
+    from memory instead of hitting the remote API again. Concurrent calls
+    with the same arguments share a single in-flight request (singleflight).
+    Entries are evicted least-recently-used once max_size is reached.
+    
+    Args:
+        ttl_seconds: How long a cached result stays valid
+        max_size: Maximum number of cached entries (default: 128)
+        ignore: Parameter names excluded from the cache key (default: session)
+    
+    Returns:
+        Decorator; the wrapped function gains cache_info() and cache_clear()
+    
+    Example:
+        >>> @ttl_cache(ttl_seconds=300)
+        ... def fetch(query):
+        ...     return expensive_api_call(query)
+        >>> fetch.cache_info()
+        {'hits': 0, 'misses': 0, 'size': 0, 'max_size': 128, 'ttl_seconds': 300}
+    
+    Notes:
+        - Exceptions are never cached; callers waiting on a failed
+          in-flight request receive the same exception
+        - List results are returned as shallow copies so callers can't
+          mutate the cached value
+        - Calls with unhashable arguments bypass the cache
+        - cache_clear() also drops in-flight calls, so a call that started
+          before the clear doesn't store its result
+        - Thread-safe
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        entries = OrderedDict()  # key -> (expires_at, value)
+        inflight = {}  # key -> Future of the call currently computing it
+        lock = threading.RLock()
+        stats = {'hits': 0, 'misses': 0}
+        generation = [0]  # bumped by cache_clear()
+        
+        def make_key(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(
+                (name, value) for name, value in bound.arguments.items()
+                if name not in ignore
+            )
+            hash(key)
+            return key
+        
+        def copy_result(value):
+            return list(value) if isinstance(value, list) else value
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = make_key(args, kwargs)
+            except TypeError:
+                return func(*args, **kwargs)
+            
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(key)
+                    stats['hits'] += 1
+                    return copy_result(entry[1])
+                
+                # Singleflight: join an identical call that is already running
+                future = inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = inflight[key] = Future()
+                    started_generation = generation[0]
+                    stats['misses'] += 1
+                else:
+                    stats['hits'] += 1
+            
+            if not leader:
+                return copy_result(future.result())
+            
+            try:
+                value = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    if inflight.get(key) is future:
+                        del inflight[key]
+                future.set_exception(e)
+                raise
+            
+            with lock:
+                # A call that started before cache_clear() must not
+                # repopulate the cache with data fetched before the clear
+                if started_generation == generation[0]:
+                    entries[key] = (time.monotonic() + ttl_seconds, value)
+                    entries.move_to_end(key)
+                    while len(entries) > max_size:
+                        entries.popitem(last=False)
+                if inflight.get(key) is future:
+                    del inflight[key]
+            future.set_result(value)
+            
+            return copy_result(value)
+        
+        def cache_info() -> Dict:
+            with lock:
+                return {
+                    **stats,
+                    'size': len(entries),
+                    'max_size': max_size,
+                    'ttl_seconds': ttl_seconds
+                }
+        
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+                inflight.clear()
+                generation[0] += 1
+                stats['hits'] = stats['misses'] = 0
+        
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
+
 
 # =============================================================================
 # Event Registry Integration Functions
 # =============================================================================
 
+# Concept URIs for Bitcoin and Mining
+# These provide semantic understanding beyond keyword matching
+BITCOIN_CONCEPT_URI = "http://en.wikipedia.org/wiki/Bitcoin"
+MINING_CONCEPT_URI = "http://en.wikipedia.org/wiki/Mining"
+
+# Specific mining keywords (OR); these catch articles that may not be
+# tagged with the concepts
+MINING_QUERY_KEYWORDS = (
+    "ASIC",
+    "hashrate",
+    "mining pool",
+    "mining rig",
+    "difficulty adjustment",
+    "block reward"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _mining_query_base() -> Dict:
+    """
+    Build the date-independent Event Registry query parameters once.
+    
+    Cached because QueryItems can't be created at import time when the
+    optional eventregistry package is missing.
+    """
+    return dict(
+        # AND condition ensures articles match BOTH Bitcoin AND Mining
+        conceptUri=QueryItems.AND([BITCOIN_CONCEPT_URI, MINING_CONCEPT_URI]),
+        keywords=QueryItems.OR(list(MINING_QUERY_KEYWORDS)),
+        lang="eng",  # English only
+        isDuplicateFilter="skipDuplicates"  # Skip duplicate articles
+    )
+
+
+def _build_mining_query(date_start: str, date_end: str) -> Dict:
+    """Return QueryArticles keyword arguments for the mining search in a date range."""
+    return {**_mining_query_base(), 'dateStart': date_start, 'dateEnd': date_end}
+
+
+@functools.lru_cache(maxsize=None)
+def _mining_return_info() -> "ReturnInfo":
+    """
+    Build the ReturnInfo for mining article searches once.
+    
+    Requests only the article fields the bot uses (title, body, url, date,
+    source, image, sentiment are SDK defaults). socialScore is off by
+    default and must be enabled for MIN_SOCIAL_SCORE filtering to work;
+    the full body is kept because the mining-relevance filter scans it.
+    """
+    return ReturnInfo(
+        articleInfo=ArticleInfoFlags(
+            socialScore=True,
+            eventUri=False,
+            authors=False
+        )
+    )
+
+
+def _validate_dates(*values: str) -> None:
+    """
+    Check that each value is a real YYYY-MM-DD date.
+    
+    Uses a regex for the shape and date.fromisoformat() for the calendar
+    (e.g. rejects 2024-02-30).
+    
+    Raises:
+        ValueError: If any value is not a valid YYYY-MM-DD date
+    """
+    try:
+        for value in values:
+            if not _DATE_RE.match(value):
+                raise ValueError(f"{value!r} does not match YYYY-MM-DD")
+            date.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid date format. Use YYYY-MM-DD: {e}")
+
+
+@ttl_cache(ttl_seconds=300, ignore=('max_retries',))
 def fetch_bitcoin_mining_articles(
     api_key: str,
     date_start: str,
     date_end: str,
-    max_articles: int = 100
+    max_articles: int = 100,
+    max_retries: int = 3
 ) -> List[Dict]:
     """
     Fetch Bitcoin mining related articles from Event Registry.
@@ -60,6 +327,7 @@ def fetch_bitcoin_mining_articles(
         date_start: Start date in YYYY-MM-DD format (e.g., "2024-01-01")
         date_end: End date in YYYY-MM-DD format (e.g., "2024-01-31")
         max_articles: Maximum number of articles to fetch (default: 100)
+        max_retries: Retries for connection errors, 429 and 5xx (default: 3)
     
     Returns:
         List of article dictionaries with the following structure:
@@ -101,71 +369,118 @@ def fetch_bitcoin_mining_articles(
         'Bitcoin Mining Difficulty Reaches New All-Time High'
     
     Notes:
-        - Uses QueryArticlesIter for efficient pagination
+        - Up to 100 articles are fetched in one request sized to max_articles;
+          larger requests use QueryArticlesIter pagination
         - Automatically skips duplicate articles
         - Filters to English language articles only
         - Social score ranges from 0 (no engagement) to 100+ (viral)
         - Concepts help understand article topics beyond keywords
+        - Only fields used downstream are requested (title, body, url, date,
+          source, image, socialScore, sentiment) to keep responses small
+        - Results are cached for 5 minutes per argument set (see ttl_cache())
         
     See Also:
         - eventregistry_guide.md: Complete guide to Event Registry API
         - eventregistry_examples.py: More usage examples
         - fetch_articles_with_retry(): Version with automatic retry logic
     """
-    from eventregistry import (
-        EventRegistry,
-        QueryArticlesIter,
-        QueryItems,
-        ReturnInfo,
-        ArticleInfoFlags
-    )
+    if not EVENTREGISTRY_AVAILABLE:
+        raise ImportError("eventregistry library required: pip install eventregistry")
     
-    # Validate date format
-    try:
-        datetime.strptime(date_start, "%Y-%m-%d")
-        datetime.strptime(date_end, "%Y-%m-%d")
-    except ValueError as e:
-        raise ValueError(f"Invalid date format. Use YYYY-MM-DD: {e}")
+    _validate_dates(date_start, date_end)
     
-    # Initialize Event Registry client
-    er = EventRegistry(apiKey=api_key)
-    
-    # Concept URIs for Bitcoin and Mining
-    # These provide semantic understanding beyond keyword matching
-    bitcoin_concept = "http://en.wikipedia.org/wiki/Bitcoin"
-    mining_concept = "http://en.wikipedia.org/wiki/Mining"
-    
-    # Create query with concept-based search
-    # AND condition ensures articles match BOTH Bitcoin AND Mining
-    # Note: QueryArticlesIter returns all fields by default, so no need to call setRequestedResult
-    query = QueryArticlesIter(
-        conceptUri=QueryItems.AND([
-            bitcoin_concept,
-            mining_concept
-        ]),
-        # OR condition for specific mining keywords
-        # These catch articles that may not be tagged with concepts
-        keywords=QueryItems.OR([
-            "ASIC",
-            "hashrate",
-            "mining pool",
-            "mining rig",
-            "difficulty adjustment",
-            "block reward"
-        ]),
-        dateStart=date_start,
-        dateEnd=date_end,
-        lang="eng",  # English only
-        isDuplicateFilter="skipDuplicates"  # Skip duplicate articles
-    )
+    # Reuse this thread's pooled Event Registry client for this API key
+    er = _get_event_registry_client(api_key, max_retries)
+    
+    # Static parts of the query and ReturnInfo are built once and reused
+    return_info = _mining_return_info()
+    query_params = _build_mining_query(date_start, date_end)
     
     # Fetch articles sorted by social engagement
     # Higher social score = more viral/trending content
-    articles = []
-    for article in query.execQuery(er, sortBy="socialScore", maxItems=max_articles):
-        articles.append(article)
+    if 0 < max_articles <= 100:
+        # Fits in one page: request exactly max_articles in a single call.
+        # QueryArticlesIter always downloads full 100-article pages.
+        query = QueryArticles(**query_params)
+        query.setRequestedResult(RequestArticlesInfo(
+            page=1,
+            count=max_articles,
+            sortBy="socialScore",
+            returnInfo=return_info
+        ))
+        response = er.execQuery(query)
+        if "error" in response:
+            raise Exception(f"Event Registry error: {response['error']}")
+        return response.get("articles", {}).get("results", [])
+    
+    # Larger requests page through results; the SDK serializes requests per
+    # client, so pages are fetched one after another
+    query = QueryArticlesIter(**query_params)
+    return list(query.execQuery(
+        er,
+        sortBy="socialScore",
+        returnInfo=return_info,
+        maxItems=max_articles
+    ))
+
+
+# EventRegistry clients, one per thread (see _get_event_registry_client)
+_er_clients = threading.local()
+
+
+def _get_event_registry_client(api_key: str, max_retries: int = 3) -> "EventRegistry":
+    """
+    Return this thread's EventRegistry client for an API key.
     
-    return articles
+    The SDK holds a per-client lock for the whole of each request and spaces
+    requests by minDelayBetweenRequests, so one shared client would run
+    concurrent fetches one at a time. Each thread therefore gets its own
+    client, created once and reused so its HTTP session (and the kept-alive
+    TLS connection) serves every query from that thread.
+    
+    Args:
+        api_key: Event Registry API key
+        max_retries: Retries for connection errors, 429 and 5xx
+    
+    Returns:
+        eventregistry.EventRegistry instance
+    """
+    clients = _er_clients.__dict__.setdefault('clients', {})
+    er = clients.get((api_key, max_retries))
+    if er is None:
+        er = clients[(api_key, max_retries)] = _create_event_registry_client(api_key, max_retries)
+    return er
+
+
+def _create_event_registry_client(api_key: str, max_retries: int) -> "EventRegistry":
+    """
+    Create an EventRegistry client whose retries are handled by urllib3.
+    
+    Transient failures (connection errors, 429, 5xx) are retried with
+    jittered exponential backoff, honoring Retry-After, instead of the
+    SDK's fixed 5-second delay. This mounts an adapter on the SDK's private HTTP session
+    (eventregistry 9.x-10.x, pinned in requirements.txt); if that session
+    isn't there, the client falls back to the SDK's own retries.
+    """
+    # repeatFailedRequestCount=0: a single SDK-level attempt, the adapter
+    # below handles retries
+    er = EventRegistry(apiKey=api_key, repeatFailedRequestCount=0)
+    
+    session = getattr(er, '_reqSession', None)
+    if not isinstance(session, requests.Session):
+        return EventRegistry(apiKey=api_key, repeatFailedRequestCount=max_retries)
+    
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=2,
+        backoff_jitter=2.0,  # concurrent fetchers don't retry in lockstep
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=None,  # the SDK sends every query as a POST
+        respect_retry_after_header=True
+    )
+    session.mount('https://', HTTPAdapter(max_retries=retry))
+    
+    return er
 
 
 def fetch_articles_with_retry(
@@ -179,20 +494,22 @@ def fetch_articles_with_retry(
     Fetch articles with automatic retry logic for transient failures.
     
     This is a production-ready version of fetch_bitcoin_mining_articles()
-    that includes exponential backoff for rate limiting and transient errors.
+    with a configurable retry budget. Connection errors, rate limiting (429)
+    and 5xx responses are retried by the client's HTTP adapter with
+    exponential backoff; other errors are raised immediately.
     
     Args:
         api_key: Event Registry API key
         date_start: Start date (YYYY-MM-DD)
         date_end: End date (YYYY-MM-DD)
         max_articles: Maximum articles to fetch
-        max_retries: Maximum number of retry attempts
+        max_retries: Maximum number of retries per request
     
     Returns:
         List of article dictionaries
     
     Raises:
-        APIError: If all retry attempts fail
+        Exception: If the request still fails after all retries
     
     Example:
         >>> articles = fetch_articles_with_retry(
@@ -202,41 +519,57 @@ def fetch_articles_with_retry(
         ...     max_retries=5
         ... )
     """
-    for attempt in range(max_retries):
-        try:
-            return fetch_bitcoin_mining_articles(
-                api_key,
-                date_start,
-                date_end,
-                max_articles
-            )
-        except Exception as e:
-            error_msg = str(e).lower()
-            
-            # Don't retry authentication errors
-            if "invalid api key" in error_msg or "authentication" in error_msg:
-                raise
-            
-            # Retry with exponential backoff for rate limits
-            if "rate limit" in error_msg:
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) * 10  # 10, 20, 40 seconds
-                    print(f"Rate limit hit, waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                else:
-                    raise
-            
-            # Retry other transient errors
-            elif attempt < max_retries - 1:
-                wait_time = (2 ** attempt) * 5  # 5, 10, 20 seconds
-                print(f"Error occurred, retrying in {wait_time}s...")
-                time.sleep(wait_time)
-            else:
-                raise
+    return fetch_bitcoin_mining_articles(
+        api_key,
+        date_start,
+        date_end,
+        max_articles,
+        max_retries=max_retries
+    )
+
+
+async def fetch_articles_async(
+    api_key: str,
+    date_start: str,
+    date_end: str,
+    max_articles: int = 100,
+    max_retries: int = 3
+) -> List[Dict]:
+    """
+    Async version of fetch_articles_with_retry().
+    
+    The Event Registry SDK is blocking, so the fetch runs in a worker
+    thread. Each worker thread has its own client (see
+    _get_event_registry_client()), which lets several date ranges or
+    queries be fetched concurrently.
     
-    return []
+    Args:
+        api_key: Event Registry API key
+        date_start: Start date (YYYY-MM-DD)
+        date_end: End date (YYYY-MM-DD)
+        max_articles: Maximum articles to fetch
+        max_retries: Maximum number of retries per request
+    
+    Returns:
+        List of article dictionaries
+    
+    Example:
+        >>> week1, week2 = await asyncio.gather(
+        ...     fetch_articles_async(api_key, "2024-01-01", "2024-01-07"),
+        ...     fetch_articles_async(api_key, "2024-01-08", "2024-01-14")
+        ... )
+    """
+    return await asyncio.to_thread(
+        fetch_articles_with_retry,
+        api_key,
+        date_start,
+        date_end,
+        max_articles,
+        max_retries
+    )
 
 
+@ttl_cache(ttl_seconds=900)
 def get_trending_mining_articles(
     api_key: str,
     days_back: int = 7,
@@ -259,9 +592,11 @@ def get_trending_mining_articles(
         >>> trending = get_trending_mining_articles(api_key, days_back=3)
         >>> for article in trending[:5]:
         ...     print(f"{article['socialScore']}: {article['title']}")
+    
+    Notes:
+        - Results are cached for 15 minutes per argument set (see ttl_cache())
     """
-    date_end = datetime.now().strftime("%Y-%m-%d")
-    date_start = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    date_start, date_end = get_date_range(days_back)
     
     return fetch_bitcoin_mining_articles(
         api_key,
@@ -271,6 +606,69 @@ def get_trending_mining_articles(
     )
 
 
+def fetch_articles_bulk(
+    api_key: str,
+    windows: List[Tuple[str, str]],
+    max_articles: int = 100
+) -> Dict[Tuple[str, str], List[Dict]]:
+    """
+    Fetch articles for several date windows with a single Event Registry query.
+    
+    Instead of issuing one query per window, queries the span covering all
+    windows once and partitions the results locally by article date.
+    
+    Args:
+        api_key: Event Registry API key
+        windows: List of (date_start, date_end) tuples (YYYY-MM-DD, inclusive)
+        max_articles: Maximum articles to fetch across all windows (default: 100)
+    
+    Returns:
+        Dictionary mapping each window tuple to its list of articles
+    
+    Raises:
+        ValueError: If any window date is invalid format, or a window
+            starts after it ends
+    
+    Example:
+        >>> windows = [("2024-01-01", "2024-01-07"), ("2024-01-08", "2024-01-14")]
+        >>> by_week = fetch_articles_bulk(api_key, windows, max_articles=200)
+        >>> for (start, end), articles in by_week.items():
+        ...     print(f"{start}..{end}: {len(articles)} articles")
+    
+    Notes:
+        - max_articles applies to the combined span, not per window; since
+          the top articles by socialScore are taken across the whole span,
+          quieter windows can come back empty where a separate query per
+          window would have returned articles
+        - Articles in overlapping windows are included in each of them
+        - Articles keep the socialScore ordering of the underlying query
+    """
+    if not windows:
+        return {}
+    
+    # Validate every window before the span is computed from them
+    for start, end in windows:
+        _validate_dates(start, end)
+        if start > end:
+            raise ValueError(f"Window starts after it ends: {start!r} > {end!r}")
+    
+    articles = fetch_bitcoin_mining_articles(
+        api_key,
+        min(start for start, _ in windows),
+        max(end for _, end in windows),
+        max_articles
+    )
+    
+    results = {window: [] for window in windows}
+    for article in articles:
+        article_date = (article.get('date') or '')[:10]
+        for start, end in windows:
+            if start <= article_date <= end:
+                results[(start, end)].append(article)
+    
+    return results
+
+
 # =============================================================================
 # Article Filtering Functions
 # =============================================================================
@@ -329,62 +727,139 @@ def filter_articles(
     
     Notes:
         - Case-insensitive keyword matching in title and body
-        - Source matching uses the 'uri' field from source dict
+        - Source matching uses the 'uri' field from source dict; domain
+          entries also block their subdomains, other entries match as substrings
         - Returns empty list if all articles are filtered out
         - Preserves original article order
+        - See filter_articles_stream() for a lazy generator version
+    """
+    return list(filter_articles_stream(
+        articles,
+        blacklisted_sources,
+        blacklisted_keywords,
+        min_social_score=min_social_score,
+        min_sentiment=min_sentiment,
+        min_length=min_length,
+        min_mining_terms=min_mining_terms
+    ))
+
+
+def filter_articles_stream(
+    articles: Iterable[Dict],
+    blacklisted_sources: List[str],
+    blacklisted_keywords: List[str],
+    min_social_score: float = 0.0,
+    min_sentiment: float = -1.0,
+    min_length: int = 0,
+    min_mining_terms: int = 2
+) -> Iterator[Dict]:
     """
-    filtered = []
+    Generator form of filter_articles().
+    
+    Applies the same criteria but yields articles one at a time, so it can
+    consume a lazy source such as iter_articles_from_json() without holding
+    the whole input in memory.
     
+    Args:
+        articles: Iterable of article dictionaries
+        (remaining arguments as in filter_articles())
+    
+    Yields:
+        Articles that pass all criteria, in input order
+    
+    Example:
+        >>> articles = iter_articles_from_json("archive.json")
+        >>> for article in filter_articles_stream(articles, [], ["sponsored"]):
+        ...     print(article['title'])
+    """
     # Initialize the mining filter
     mining_filter = BitcoinMiningFilter(min_mining_terms=min_mining_terms)
     
+    # Lowercase the blacklists once rather than per article and entry.
+    # Domain entries are matched by set lookup; anything else (partial
+    # names, patterns) falls back to a substring scan.
+    sources = [source.lower() for source in blacklisted_sources]
+    blocked_domains = frozenset(
+        source for source in sources if '.' in source and '*' not in source
+    )
+    source_patterns = tuple(
+        source.replace('*', '') for source in sources if source not in blocked_domains
+    )
+    keywords = tuple(keyword.lower() for keyword in blacklisted_keywords)
+    
+    # Skip checks that can't reject anything at their permissive defaults
+    # (social scores are >= 0, sentiment is in [-1, 1])
+    check_social = min_social_score > 0
+    check_sentiment = min_sentiment > -1.0
+    check_length = min_length > 0
+    check_sources = bool(sources)
+    
     for article in articles:
-        # Check required fields
-        if not article.get('title') or not article.get('url') or not article.get('body'):
+        # Cheapest checks first: field presence and numeric thresholds
+        raw_title = article.get('title')
+        raw_body = article.get('body')
+        if not raw_title or not article.get('url') or not raw_body:
             continue
         
-        # Check blacklisted sources
-        source_uri = article.get('source', {}).get('uri', '').lower()
-        if any(blacklisted.lower() in source_uri for blacklisted in blacklisted_sources):
+        # Check social score threshold
+        if check_social and article.get('socialScore', 0) < min_social_score:
             continue
         
-        # Check blacklisted keywords in title and body
-        title = article.get('title', '').lower()
-        body = article.get('body', '').lower()
-        
-        if any(keyword.lower() in title or keyword.lower() in body 
-               for keyword in blacklisted_keywords):
+        # Check sentiment threshold
+        if check_sentiment and article.get('sentiment', 0) < min_sentiment:
             continue
         
-        # Check social score threshold
-        social_score = article.get('socialScore', 0)
-        if social_score < min_social_score:
+        # Check minimum article length
+        if check_length and len(raw_body) < min_length:
             continue
         
-        # Check sentiment threshold
-        sentiment = article.get('sentiment', 0)
-        if sentiment < min_sentiment:
+        # Check blacklisted sources
+        if check_sources:
+            source = article.get('source')
+            source_uri = (source.get('uri') or '').lower() if source else ''
+            if not blocked_domains.isdisjoint(_domain_suffixes(source_uri)):
+                continue
+            if any(pattern in source_uri for pattern in source_patterns):
+                continue
+        
+        # Check blacklisted keywords in the title, then the (much longer)
+        # body, which is only lowercased if the title is clean
+        title = raw_title.lower()
+        if keywords and any(keyword in title for keyword in keywords):
             continue
         
-        # Check minimum article length
-        body_length = len(article.get('body', ''))
-        if body_length < min_length:
+        body = raw_body.lower()
+        if keywords and any(keyword in body for keyword in keywords):
             continue
         
-        # Check mining relevance using BitcoinMiningFilter
-        if not mining_filter._is_mining_relevant(article):
+        # Check mining relevance using BitcoinMiningFilter, reusing the
+        # lowercased text rather than lowercasing the article again
+        if not mining_filter.is_mining_relevant_text(title, body):
             continue
         
-        filtered.append(article)
+        yield article
+
+
+def _domain_suffixes(host: str) -> List[str]:
+    """
+    Return a host name and each of its parent domains.
     
-    return filtered
+    Example:
+        >>> _domain_suffixes("news.example.co.uk")
+        ['news.example.co.uk', 'example.co.uk', 'co.uk']
+    """
+    parts = host.split('.')
+    return ['.'.join(parts[i:]) for i in range(max(len(parts) - 1, 1))]
 
 
 def remove_duplicate_articles(articles: List[Dict]) -> List[Dict]:
     """
     Remove duplicate articles based on URL.
     
-    Keeps the first occurrence of each unique URL.
+    Keeps the first occurrence of each unique URL. URLs are compared after
+    normalization with canonical_url() (case-insensitive scheme/host,
+    fragment ignored), so
+    'https://Example.com/a#top' and 'https://example.com/a' are duplicates.
     
     Args:
         articles: List of article dictionaries
@@ -402,16 +877,105 @@ def remove_duplicate_articles(articles: List[Dict]) -> List[Dict]:
         >>> print(len(unique))
         2
     """
-    seen_urls = set()
-    unique_articles = []
+    unique: Dict[str, Dict] = {}  # canonical URL -> first article
     
     for article in articles:
         url = article.get('url')
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            unique_articles.append(article)
+        if url:
+            unique.setdefault(canonical_url(url), article)
+    
+    return list(unique.values())
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL for duplicate detection.
+    
+    Lowercases the scheme and host and drops the #fragment; path and query
+    are kept as-is since they are case-sensitive on most servers. Use it
+    wherever URLs are compared against remove_duplicate_articles() results.
+    
+    Args:
+        url: Article URL
+    
+    Returns:
+        Normalized URL
+    
+    Example:
+        >>> canonical_url("HTTPS://Example.com/Article#comments")
+        'https://example.com/Article'
+    """
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+
+
+def remove_near_duplicate_articles(
+    articles: List[Dict],
+    max_distance: int = 3,
+    seen: Iterable[Dict] = ()
+) -> List[Dict]:
+    """
+    Remove near-duplicate articles based on content.
+    
+    Syndicated stories are often republished under different URLs with
+    small edits, so remove_duplicate_articles() keeps every copy. This
+    compares a 64-bit SimHash of each article's title and the first 500
+    characters of its body, and drops articles whose fingerprint differs
+    from an already-kept one in at most `max_distance` bits.
+    
+    Args:
+        articles: List of article dictionaries
+        max_distance: Maximum Hamming distance between fingerprints for
+            two articles to count as duplicates (default: 3)
+        seen: Articles kept earlier (e.g. the queue); new articles that
+            near-duplicate one of them are dropped too (default: none)
+    
+    Returns:
+        List with near-duplicates removed, keeping the first occurrence
+    
+    Example:
+        >>> unique = remove_duplicate_articles(articles)
+        >>> unique = remove_near_duplicate_articles(unique, seen=queue)
     
-    return unique_articles
+    Notes:
+        - Compares each article against every kept one (O(n^2)), which is
+          fine for the ~100 articles a workflow handles per run
+    """
+    kept = []
+    fingerprints = [_article_fingerprint(article) for article in seen]
+    
+    for article in articles:
+        fingerprint = _article_fingerprint(article)
+        
+        if any((fingerprint ^ other).bit_count() <= max_distance for other in fingerprints):
+            continue
+        
+        fingerprints.append(fingerprint)
+        kept.append(article)
+    
+    return kept
+
+
+def _article_fingerprint(article: Dict) -> int:
+    """SimHash of an article's title and the first 500 characters of its body."""
+    return _simhash(f"{article.get('title') or ''} {(article.get('body') or '')[:500]}")
+
+
+def _simhash(text: str) -> int:
+    """
+    Compute a 64-bit SimHash of the words in `text`.
+    
+    Each word votes on every bit with its hash, weighted by how often it
+    occurs. Similar texts get fingerprints that differ in only a few bits.
+    """
+    weights = [0] * 64
+    
+    for token, count in Counter(re.findall(r'\w+', text.lower())).items():
+        h = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'little')
+        for bit in range(64):
+            weights[bit] += count if h >> bit & 1 else -count
+    
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
 
 
 # =============================================================================
@@ -463,15 +1027,75 @@ def generate_social_media_content(
     pass
 
 
+# =============================================================================
+# HTTP Helpers
+# =============================================================================
+
+def create_http_session(
+    pool_maxsize: int = 10,
+    max_retries: int = 3,
+    retry_post: bool = False
+) -> requests.Session:
+    """
+    Create a requests Session with connection pooling and automatic retries.
+    
+    Reusing one session keeps TCP/TLS connections alive between calls, so
+    back-to-back requests to the same host (e.g. several image downloads
+    from images.unsplash.com) skip the handshake. Connection errors and
+    429/5xx responses are retried by urllib3 with exponential backoff,
+    honouring Retry-After.
+    
+    Args:
+        pool_maxsize: Maximum pooled connections per host (default: 10)
+        max_retries: Maximum retries per request (default: 3)
+        retry_post: Also retry POST requests (default: False). Only
+                   responses where nothing was created (429, 503) and
+                   connection failures are retried then; read timeouts
+                   and other 5xx are not, since the server may already
+                   have acted on the request. Once retries run out the
+                   last response is returned rather than raised.
+    
+    Returns:
+        Configured requests.Session (close it, or use it as a context manager)
+    
+    Example:
+        >>> with create_http_session() as session:
+        ...     images = fetch_unsplash_images(key, "bitcoin mining", session=session)
+    """
+    if retry_post:
+        retry = Retry(
+            total=max_retries,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 503],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+            raise_on_status=False
+        )
+    else:
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 # =============================================================================
 # Image Fetching and Optimization Functions
 # =============================================================================
 
+@ttl_cache(ttl_seconds=3600)
 def fetch_unsplash_images(
     unsplash_access_key: str,
     query: str,
     count: int = 2,
-    orientation: str = "landscape"
+    orientation: str = "landscape",
+    session: Optional[requests.Session] = None
 ) -> List[Dict]:
     """
     Fetch images from Unsplash API related to a search query.
@@ -484,6 +1108,7 @@ def fetch_unsplash_images(
         query: Search query (e.g., "bitcoin mining", "cryptocurrency")
         count: Number of images to fetch (default: 2, max: 30)
         orientation: Image orientation - "landscape", "portrait", or "squarish"
+        session: Optional requests.Session to reuse (see create_http_session())
     
     Returns:
         List of image dictionaries with structure:
@@ -522,9 +1147,8 @@ def fetch_unsplash_images(
         - Always credit photographer when possible
         - API rate limit: 50 requests/hour (free tier)
         - Use specific queries for better results
+        - Results are cached for 1 hour per query (see ttl_cache())
     """
-    import requests
-    
     if count < 1 or count > 30:
         raise ValueError("Count must be between 1 and 30")
     
@@ -541,8 +1165,10 @@ def fetch_unsplash_images(
         "orientation": orientation
     }
     
+    http = session or requests
+    
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = http.get(url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -566,13 +1192,18 @@ def fetch_unsplash_images(
         raise Exception(f"Unsplash API error: {e}")
 
 
-def download_image(image_url: str, output_path: str) -> str:
+def download_image(
+    image_url: str,
+    output_path: str,
+    session: Optional[requests.Session] = None
+) -> str:
     """
     Download an image from a URL to local storage.
     
     Args:
         image_url: URL of the image to download
         output_path: Local path where image will be saved
+        session: Optional requests.Session to reuse (see create_http_session())
     
     Returns:
         Path to the downloaded image file
@@ -587,18 +1218,23 @@ def download_image(image_url: str, output_path: str) -> str:
         ... )
         >>> print(f"Downloaded to: {path}")
         Downloaded to: /tmp/bitcoin_mining.jpg
+    
+    Notes:
+        - Response is streamed to disk in 64KB chunks (constant memory use)
     """
-    import requests
+    http = session or requests
     
     try:
-        response = requests.get(image_url, timeout=30)
-        response.raise_for_status()
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the body so full-resolution images are never held in memory
+        with http.get(image_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            
+            # Ensure directory exists
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            
+            with open(output_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
         
         return output_path
     
@@ -610,7 +1246,8 @@ def optimize_image_for_twitter(
     input_path: str,
     output_path: Optional[str] = None,
     target_size: Tuple[int, int] = (1600, 900),
-    quality: int = 85
+    quality: int = 85,
+    max_size_mb: float = 5
 ) -> str:
     """
     Optimize an image for Twitter posting.
@@ -625,6 +1262,7 @@ def optimize_image_for_twitter(
         output_path: Path for optimized image (defaults to input_path with _optimized suffix)
         target_size: Target dimensions as (width, height) tuple (default: 1600x900)
         quality: JPEG quality 1-100 (default: 85)
+        max_size_mb: Maximum output file size in MB (default: 5, Twitter's limit)
     
     Returns:
         Path to the optimized image file
@@ -645,12 +1283,13 @@ def optimize_image_for_twitter(
     Notes:
         - Maintains aspect ratio by cropping to fit
         - Centers crop for best composition
+        - Oversized JPEGs are decoded at reduced scale via Image.draft()
+        - Saves progressive JPEG; quality is lowered in steps of 10 (down to
+          50) if the result would exceed max_size_mb
         - Reduces file size while maintaining quality
         - Twitter supports up to 4 images per tweet
     """
-    try:
-        from PIL import Image, ImageOps
-    except ImportError:
+    if not PIL_AVAILABLE:
         raise ImportError("Pillow library required: pip install Pillow")
     
     if not os.path.exists(input_path):
@@ -662,33 +1301,53 @@ def optimize_image_for_twitter(
         output_path = f"{base}_optimized{ext}"
     
     try:
-        # Open and process image
         with Image.open(input_path) as img:
-            # Convert to RGB if necessary (handles RGBA, P, etc.)
-            if img.mode not in ('RGB', 'L'):
-                img = img.convert('RGB')
-            
-            # Calculate dimensions to fit target aspect ratio
-            target_width, target_height = target_size
-            target_aspect = target_width / target_height
-            current_aspect = img.width / img.height
-            
-            if current_aspect > target_aspect:
-                # Image is wider - crop width
-                new_width = int(img.height * target_aspect)
-                left = (img.width - new_width) // 2
-                img = img.crop((left, 0, left + new_width, img.height))
-            elif current_aspect < target_aspect:
-                # Image is taller - crop height
-                new_height = int(img.width / target_aspect)
-                top = (img.height - new_height) // 2
-                img = img.crop((0, top, img.width, top + new_height))
-            
-            # Resize to target dimensions
-            img = img.resize(target_size, Image.Resampling.LANCZOS)
-            
-            # Save optimized image
-            img.save(output_path, 'JPEG', quality=quality, optimize=True)
+            _save_for_twitter(img, output_path, target_size, quality, max_size_mb)
+        
+        return output_path
+    
+    except Exception as e:
+        raise ValueError(f"Failed to optimize image: {e}")
+
+
+def optimize_image_bytes(
+    data: bytes,
+    output_path: str,
+    target_size: Tuple[int, int] = (1600, 900),
+    quality: int = 85,
+    max_size_mb: float = 5
+) -> str:
+    """
+    Optimize an in-memory image for Twitter posting.
+    
+    Same processing as optimize_image_for_twitter(), but reads the source
+    image from bytes (e.g. an HTTP response body) so it never has to be
+    written to disk first.
+    
+    Args:
+        data: Encoded image bytes (JPEG, PNG, etc.)
+        output_path: Path for the optimized image
+        target_size: Target dimensions as (width, height) tuple (default: 1600x900)
+        quality: JPEG quality 1-100 (default: 85)
+        max_size_mb: Maximum output file size in MB (default: 5)
+    
+    Returns:
+        Path to the optimized image file
+    
+    Raises:
+        ValueError: If image cannot be processed
+    
+    Example:
+        >>> response = session.get(image_url, timeout=30)
+        >>> optimize_image_bytes(response.content, "/tmp/bitcoin_optimized.jpg")
+        '/tmp/bitcoin_optimized.jpg'
+    """
+    if not PIL_AVAILABLE:
+        raise ImportError("Pillow library required: pip install Pillow")
+    
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            _save_for_twitter(img, output_path, target_size, quality, max_size_mb)
         
         return output_path
     
@@ -696,25 +1355,85 @@ def optimize_image_for_twitter(
         raise ValueError(f"Failed to optimize image: {e}")
 
 
+def _save_for_twitter(
+    img: "Image.Image",
+    output_path: str,
+    target_size: Tuple[int, int],
+    quality: int,
+    max_size_mb: float
+) -> None:
+    """
+    Crop, resize and encode an opened PIL image as a Twitter-ready JPEG.
+    
+    Shared by optimize_image_for_twitter() and optimize_image_bytes().
+    """
+    # Let libjpeg decode at a reduced scale (1/2, 1/4, 1/8) when the
+    # source is far larger than needed; no-op for other formats. Photos
+    # stored rotated (EXIF orientation 5-8) are decoded sideways, so the
+    # requested size is swapped to match.
+    draft_size = (target_size[0] * 2, target_size[1] * 2)
+    if img.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+        draft_size = draft_size[::-1]
+    img.draft('RGB', draft_size)
+    
+    # Apply the EXIF orientation so phone photos aren't posted sideways
+    ImageOps.exif_transpose(img, in_place=True)
+    
+    # Convert to RGB if necessary (handles RGBA, P, etc.)
+    if img.mode not in ('RGB', 'L'):
+        img = img.convert('RGB')
+    
+    # Center-crop to the target aspect ratio and resize in one pass
+    img = ImageOps.fit(
+        img,
+        target_size,
+        method=Image.Resampling.LANCZOS,
+        centering=(0.5, 0.5)
+    )
+    
+    # Encode in memory as progressive JPEG (smaller than baseline at
+    # the same quality), stepping quality down if over the size cap
+    max_bytes = int(max_size_mb * 1024 * 1024)
+    while True:
+        buffer = io.BytesIO()
+        img.save(
+            buffer,
+            'JPEG',
+            quality=quality,
+            optimize=True,
+            progressive=True,
+            subsampling='4:2:0'
+        )
+        if buffer.tell() <= max_bytes or quality <= 50:
+            break
+        quality -= 10
+    
+    with open(output_path, 'wb') as f:
+        f.write(buffer.getbuffer())
+
+
 def fetch_and_prepare_images(
     unsplash_access_key: str,
     query: str,
     output_dir: str = "/tmp/bitcoin_images",
-    count: int = 2
+    count: int = 2,
+    session: Optional[requests.Session] = None
 ) -> List[str]:
     """
     Fetch images from Unsplash and prepare them for Twitter posting.
     
     Complete workflow:
     1. Search Unsplash for relevant images
-    2. Download images to local storage
-    3. Optimize images to Twitter specifications
+    2. Download CDN-resized copies (1600x900) into memory
+    3. Optimize images to Twitter specifications and save them
     
     Args:
         unsplash_access_key: Unsplash API access key
         query: Search query for images
         output_dir: Directory to store downloaded images
         count: Number of images to fetch (default: 2)
+        session: Optional requests.Session to reuse; a pooled session is
+                 created for the duration of the call if not provided
     
     Returns:
         List of paths to optimized images ready for Twitter posting
@@ -737,42 +1456,91 @@ def fetch_and_prepare_images(
     
     Notes:
         - Creates output directory if it doesn't exist
-        - Automatically cleans up raw downloads
+        - Images are downloaded and optimized concurrently; order is preserved
+        - Only optimized images are written to disk (no raw downloads)
         - Returns empty list if no images found
         - Safe to use in automated workflows
     """
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
-    # Fetch images from Unsplash
-    images = fetch_unsplash_images(unsplash_access_key, query, count)
+    # One pooled session for the search and all downloads
+    owns_session = session is None
+    if owns_session:
+        session = create_http_session()
     
-    if not images:
-        return []
+    try:
+        # Fetch images from Unsplash
+        images = fetch_unsplash_images(unsplash_access_key, query, count, session=session)
+        
+        if not images:
+            return []
+        
+        # Download + optimize each image in its own worker thread. Downloads
+        # are network-bound and Pillow releases the GIL while decoding,
+        # resampling and encoding, so images overlap instead of queuing.
+        with ThreadPoolExecutor(max_workers=min(len(images), 8)) as pool:
+            results = pool.map(
+                lambda item: _prepare_image(item[0], item[1], output_dir, session),
+                enumerate(images, start=1)
+            )
+            optimized_paths = [path for path in results if path]
+        
+        return optimized_paths
     
-    optimized_paths = []
+    finally:
+        if owns_session:
+            session.close()
+
+
+def _prepare_image(
+    index: int,
+    image: Dict,
+    output_dir: str,
+    session: requests.Session
+) -> Optional[str]:
+    """
+    Download and optimize a single Unsplash image for fetch_and_prepare_images().
     
-    for i, image in enumerate(images):
-        try:
-            # Download image
-            raw_path = os.path.join(output_dir, f"image_{i+1}_raw.jpg")
-            download_image(image['download_url'], raw_path)
-            
-            # Optimize for Twitter
-            optimized_path = os.path.join(output_dir, f"image_{i+1}_optimized.jpg")
-            optimize_image_for_twitter(raw_path, optimized_path)
-            
-            optimized_paths.append(optimized_path)
-            
-            # Clean up raw image
-            if os.path.exists(raw_path):
-                os.remove(raw_path)
-        
-        except Exception as e:
-            print(f"Warning: Failed to process image {i+1}: {e}")
-            continue
+    The download is kept in memory and handed straight to Pillow; only the
+    optimized JPEG is written to disk.
     
-    return optimized_paths
+    Returns:
+        Path to the optimized image, or None if any step failed
+    """
+    optimized_path = os.path.join(output_dir, f"image_{index}_optimized.jpg")
+    
+    try:
+        response = session.get(_sized_unsplash_url(image['download_url']), timeout=30)
+        response.raise_for_status()
+        return optimize_image_bytes(response.content, optimized_path)
+    
+    except Exception as e:
+        print(f"Warning: Failed to process image {index}: {e}")
+        return None
+
+
+def _sized_unsplash_url(raw_url: str, target_size: Tuple[int, int] = (1600, 900)) -> str:
+    """
+    Ask Unsplash's image CDN (imgix) for a pre-cropped, pre-sized JPEG.
+    
+    Raw Unsplash URLs serve the original upload (often 5000px+ and several
+    MB); resizing on the CDN means far fewer bytes to download and decode.
+    
+    Example:
+        >>> _sized_unsplash_url("https://images.unsplash.com/photo-1?ixid=abc")
+        'https://images.unsplash.com/photo-1?ixid=abc&w=1600&h=900&fit=crop&fm=jpg&q=90'
+    """
+    parts = urlsplit(raw_url)
+    params = [(k, v) for k, v in parse_qsl(parts.query) if k not in ('w', 'h', 'fit', 'fm', 'q')]
+    params += [
+        ('w', str(target_size[0])),
+        ('h', str(target_size[1])),
+        ('fit', 'crop'),
+        ('fm', 'jpg'),
+        ('q', '90')
+    ]
+    return urlunsplit(parts._replace(query=urlencode(params)))
 
 
 # =============================================================================
@@ -867,9 +1635,9 @@ def get_date_range(days_back: int = 7) -> tuple[str, str]:
         >>> print(f"From {start} to {end}")
         From 2024-01-24 to 2024-01-31
     """
-    date_end = datetime.now().strftime("%Y-%m-%d")
-    date_start = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-    return date_start, date_end
+    # Read the clock once so both ends agree even across midnight
+    today = date.today()
+    return (today - timedelta(days=days_back)).isoformat(), today.isoformat()
 
 
 def save_articles_to_json(articles: List[Dict], filename: str) -> None:
@@ -883,11 +1651,23 @@ def save_articles_to_json(articles: List[Dict], filename: str) -> None:
     Example:
         >>> articles = fetch_bitcoin_mining_articles(api_key, "2024-01-01", "2024-01-31")
         >>> save_articles_to_json(articles, "bitcoin_mining_articles.json")
-    """
-    import json
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, indent=2, ensure_ascii=False)
+    Notes:
+        - Uses orjson when installed (much faster); falls back to the
+          stdlib json module
+        - Serialized once to UTF-8 bytes and written in a single call
+        - Values JSON can't represent are written as str(value)
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(
+            articles, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        data = json.dumps(articles, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+    
+    # Binary mode: the payload is already UTF-8, skip the text-IO encoder
+    with open(filename, 'wb') as f:
+        f.write(data)
 
 
 def load_articles_from_json(filename: str) -> List[Dict]:
@@ -903,11 +1683,150 @@ def load_articles_from_json(filename: str) -> List[Dict]:
     Example:
         >>> articles = load_articles_from_json("bitcoin_mining_articles.json")
         >>> print(f"Loaded {len(articles)} articles")
+    
+    Notes:
+        - Uses orjson when installed; falls back to the stdlib json module
+        - Files of 64 KiB or more are memory-mapped and parsed in place
+          instead of being copied through a read buffer
+    """
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        
+        # Small files: a single read is cheaper than setting up a mapping
+        if size < 64 * 1024:
+            data = f.read()
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if ORJSON_AVAILABLE:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm.read())
+
+
+def iter_articles_from_json(filename: str) -> Iterator[Dict]:
+    """
+    Lazily yield articles from a JSON array file.
+    
+    Uses ijson (when installed) to parse the file incrementally, so peak
+    memory stays at roughly one article regardless of archive size.
+    Without ijson, falls back to load_articles_from_json().
+    
+    Args:
+        filename: Input filename containing a JSON array of articles
+    
+    Yields:
+        Article dictionaries in file order
+    
+    Example:
+        >>> for article in iter_articles_from_json("archive.json"):
+        ...     print(article['title'])
+    
+    Notes:
+        - Only worth it for archives that don't comfortably fit in memory;
+          a bulk load_articles_from_json() with orjson is much faster
+    """
+    if not IJSON_AVAILABLE:
+        yield from load_articles_from_json(filename)
+        return
+    
+    with open(filename, 'rb') as f:
+        # use_float: floats as float, matching the json/orjson fallback
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+def save_articles_jsonl(articles: Iterable[Dict], filename: str, append: bool = False) -> None:
+    """
+    Save articles as JSON Lines (one compact JSON object per line).
+    
+    Unlike save_articles_to_json(), new articles can be appended without
+    loading and rewriting the existing file.
+    
+    Args:
+        articles: Iterable of article dictionaries
+        filename: Output filename (e.g., "articles.jsonl")
+        append: Append to the file instead of overwriting it (default: False)
+    
+    Example:
+        >>> save_articles_jsonl(new_articles, "archive.jsonl", append=True)
+    
+    Notes:
+        - Uses orjson when installed; falls back to the stdlib json module
+    """
+    with open(filename, 'ab' if append else 'wb') as f:
+        if ORJSON_AVAILABLE:
+            f.writelines(
+                orjson.dumps(article, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+                for article in articles
+            )
+        else:
+            f.writelines(
+                (json.dumps(article, ensure_ascii=False) + '\n').encode('utf-8')
+                for article in articles
+            )
+
+
+def iter_articles_jsonl(filename: str) -> Iterator[Dict]:
     """
-    import json
+    Lazily yield articles from a JSON Lines file.
+    
+    Args:
+        filename: Input filename written by save_articles_jsonl()
+    
+    Yields:
+        Article dictionaries in file order (blank lines are skipped)
     
-    with open(filename, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    Example:
+        >>> for article in iter_articles_jsonl("archive.jsonl"):
+        ...     print(article['title'])
+    """
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    
+    with open(filename, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def iter_articles_jsonl_reverse(filename: str, block_size: int = 64 * 1024) -> Iterator[Dict]:
+    """
+    Lazily yield articles from a JSON Lines file, last line first.
+    
+    For append-only logs this returns the newest entries first. The file is
+    read backwards from the end one block at a time, so callers that only
+    need recent entries can stop early without reading the rest of it.
+    
+    Args:
+        filename: Input filename written by save_articles_jsonl()
+        block_size: Bytes read per step from the end of the file
+    
+    Yields:
+        Article dictionaries in reverse file order (blank lines are skipped)
+    
+    Example:
+        >>> for entry in iter_articles_jsonl_reverse("posted_articles.jsonl"):
+        ...     if not entry['date'].startswith(today):
+        ...         break
+    """
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    
+    with open(filename, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b''
+        
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + partial).split(b'\n')
+            # The first piece may be the tail of a line in the previous block
+            partial = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield loads(line)
+        
+        if partial.strip():
+            yield loads(partial)
 
 
 def print_article_summary(articles: List[Dict], max_display: int = 10) -> None:
@@ -922,9 +1841,12 @@ def print_article_summary(articles: List[Dict], max_display: int = 10) -> None:
         >>> articles = fetch_bitcoin_mining_articles(api_key, "2024-01-01", "2024-01-31")
         >>> print_article_summary(articles, max_display=5)
     """
-    print(f"\n{'='*80}")
-    print(f"Article Summary: {len(articles)} total articles")
-    print(f"{'='*80}\n")
+    # Build the whole summary and write it once instead of ~3 prints per article
+    lines = [
+        f"\n{'='*80}",
+        f"Article Summary: {len(articles)} total articles",
+        f"{'='*80}\n"
+    ]
     
     for i, article in enumerate(articles[:max_display], 1):
         title = article.get('title', 'No title')
@@ -932,12 +1854,15 @@ def print_article_summary(articles: List[Dict], max_display: int = 10) -> None:
         date = article.get('date', 'Unknown')
         social_score = article.get('socialScore', 0)
         
-        print(f"{i}. {title}")
-        print(f"   Source: {source} | Date: {date} | Social Score: {social_score}")
-        print(f"   URL: {article.get('url', 'N/A')}\n")
+        lines.append(f"{i}. {title}")
+        lines.append(f"   Source: {source} | Date: {date} | Social Score: {social_score}")
+        lines.append(f"   URL: {article.get('url', 'N/A')}\n")
     
     if len(articles) > max_display:
-        print(f"... and {len(articles) - max_display} more articles")
+        lines.append(f"... and {len(articles) - max_display} more articles")
+    
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
 # =============================================================================
@@ -954,7 +1879,6 @@ if __name__ == "__main__":
     3. Generate social media content
     4. Post to social media platforms
     """
-    import os
     from dotenv import load_dotenv
     
     # Load environment variables
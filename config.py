@@ -40,6 +40,18 @@ UNSPLASH_ACCESS_KEY = os.getenv("UNSPLASH_ACCESS_KEY")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 GITHUB_REPO = os.getenv("GITHUB_REPO", "SHA256-news/scaling-engine")
 
+# All API keys by name (checked by validate_config and tools.py config-check)
+API_KEYS = {
+    'EVENT_REGISTRY_API_KEY': EVENT_REGISTRY_API_KEY,
+    'GEMINI_API_KEY': GEMINI_API_KEY,
+    'TWITTER_API_KEY': TWITTER_API_KEY,
+    'TWITTER_API_SECRET': TWITTER_API_SECRET,
+    'TWITTER_ACCESS_TOKEN': TWITTER_ACCESS_TOKEN,
+    'TWITTER_ACCESS_SECRET': TWITTER_ACCESS_SECRET,
+    'UNSPLASH_ACCESS_KEY': UNSPLASH_ACCESS_KEY,
+    'GITHUB_TOKEN': GITHUB_TOKEN
+}
+
 # =============================================================================
 # Content Filtering Configuration
 # =============================================================================
@@ -83,7 +95,8 @@ MAX_TWEET_WITH_MEDIA = 280
 
 # Queue storage paths
 QUEUE_FILE = "article_queue.json"
-POSTED_ARTICLES_FILE = "posted_articles.json"
+POSTED_ARTICLES_FILE = "posted_articles.jsonl"
+LEGACY_POSTED_ARTICLES_FILE = "posted_articles.json"  # JSON array log, imported once
 DAILY_BRIEF_CACHE = "daily_brief_cache.json"
 
 # Queue settings
@@ -105,6 +118,39 @@ POST_TIMEOUT_SECONDS = 30
 # Daily brief workflow settings (runs once per day)
 BRIEF_HOURS_BACK = 24
 BRIEF_MAX_ARTICLES = 200
+BRIEF_PROMPT_MAX_ARTICLES = 50      # Articles listed in the Gemini prompt
+BRIEF_TITLE_MAX_CHARS = 200         # Longer titles are truncated
+BRIEF_PROMPT_MAX_CHARS = 20000      # Cap on the formatted article list
+
+# API keys each workflow needs (UNSPLASH_ACCESS_KEY is optional for images)
+WORKFLOW_REQUIRED_KEYS = {
+    'monitor': ['EVENT_REGISTRY_API_KEY'],
+    'post': ['GEMINI_API_KEY', 'TWITTER_API_KEY', 'TWITTER_API_SECRET',
+             'TWITTER_ACCESS_TOKEN', 'TWITTER_ACCESS_SECRET'],
+    'daily-brief': ['GEMINI_API_KEY', 'GITHUB_TOKEN']
+}
+
+# Per-workflow settings, built once at import (see get_workflow_config)
+WORKFLOW_CONFIGS = {
+    'monitor': {
+        'hours_back': MONITOR_HOURS_BACK,
+        'max_articles': MONITOR_MAX_ARTICLES,
+        'queue_file': QUEUE_FILE,
+        'cache_file': DAILY_BRIEF_CACHE
+    },
+    'post': {
+        'queue_file': QUEUE_FILE,
+        'posted_file': POSTED_ARTICLES_FILE,
+        'retry_attempts': POST_RETRY_ATTEMPTS,
+        'timeout': POST_TIMEOUT_SECONDS,
+        'max_tweets_per_day': MAX_TWEETS_PER_DAY
+    },
+    'daily-brief': {
+        'hours_back': BRIEF_HOURS_BACK,
+        'max_articles': BRIEF_MAX_ARTICLES,
+        'cache_file': DAILY_BRIEF_CACHE
+    }
+}
 
 # =============================================================================
 # AI Content Generation - Prompt Templates
@@ -188,22 +234,39 @@ IMAGE_CACHE_DIR = "/tmp/bitcoin_mining_images"
 # Validation
 # =============================================================================
 
-def validate_config():
+def validate_config(workflow_name=None):
     """
     Validate that required configuration is present.
     
+    API keys are read from the environment once, at import, into the module
+    constants above, so this only checks those values.
+    
+    Args:
+        workflow_name: Workflow to check ('monitor', 'post', 'daily-brief'),
+            or None to check the keys of every workflow
+    
     Returns:
-        tuple: (is_valid, list_of_errors)
+        tuple: (is_valid, list_of_errors); each missing key is reported
+        once, naming every checked workflow that needs it
     """
-    errors = []
+    if workflow_name is None:
+        workflows = list(WORKFLOW_REQUIRED_KEYS)
+    elif workflow_name in WORKFLOW_REQUIRED_KEYS:
+        workflows = [workflow_name]
+    else:
+        return False, [f"Unknown workflow: {workflow_name}"]
     
-    # Check required API keys for each workflow
-    workflows = {
-        'monitor': ['EVENT_REGISTRY_API_KEY'],
-        'post': ['GEMINI_API_KEY', 'TWITTER_API_KEY', 'TWITTER_API_SECRET', 
-                 'TWITTER_ACCESS_TOKEN', 'TWITTER_ACCESS_SECRET'],
-        'daily-brief': ['GEMINI_API_KEY', 'GITHUB_TOKEN']
-    }
+    # Check required API keys for each workflow (WORKFLOW_REQUIRED_KEYS)
+    missing = {}
+    for name in workflows:
+        for key in WORKFLOW_REQUIRED_KEYS[name]:
+            if not API_KEYS.get(key):
+                missing.setdefault(key, []).append(name)
+    
+    errors = [
+        f"{key} is required for the {', '.join(names)} workflow{'s' if len(names) > 1 else ''}"
+        for key, names in missing.items()
+    ]
     
     # Optional: UNSPLASH_ACCESS_KEY for images
     
@@ -218,27 +281,6 @@ def get_workflow_config(workflow_name):
         workflow_name: One of 'monitor', 'post', 'daily-brief'
     
     Returns:
-        dict: Configuration for the specified workflow
+        dict: Configuration for the specified workflow (shared, don't modify)
     """
-    configs = {
-        'monitor': {
-            'hours_back': MONITOR_HOURS_BACK,
-            'max_articles': MONITOR_MAX_ARTICLES,
-            'queue_file': QUEUE_FILE,
-            'cache_file': DAILY_BRIEF_CACHE
-        },
-        'post': {
-            'queue_file': QUEUE_FILE,
-            'posted_file': POSTED_ARTICLES_FILE,
-            'retry_attempts': POST_RETRY_ATTEMPTS,
-            'timeout': POST_TIMEOUT_SECONDS,
-            'max_tweets_per_day': MAX_TWEETS_PER_DAY
-        },
-        'daily-brief': {
-            'hours_back': BRIEF_HOURS_BACK,
-            'max_articles': BRIEF_MAX_ARTICLES,
-            'cache_file': DAILY_BRIEF_CACHE
-        }
-    }
-    
-    return configs.get(workflow_name, {})
+    return WORKFLOW_CONFIGS.get(workflow_name, {})
@@ -1,37 +1,58 @@
 import os
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from eventregistry import ArticleInfoFlags, ReturnInfo
 from src.services.news_provider import EventRegistryProvider
 from src.app.config import EVENT_REGISTRY_API_KEY
 
 def capture_raw_articles():
     """
-    Fetches articles from Event Registry and saves the raw data to a JSON file.
+    Fetches articles from Event Registry and saves the raw data to a JSON Lines file.
+
+    Each article is written as one line as soon as it arrives, so memory use
+    stays flat no matter how many articles are captured.
     """
     print("Starting raw article capture...")
     provider = EventRegistryProvider(api_key=EVENT_REGISTRY_API_KEY)
     
     # Fetch articles from the last day
-    end_date = datetime.utcnow()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=1)
     
-    print(f"Fetching articles from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+    print(f"Fetching articles from {start_date.date().isoformat()} to {end_date.date().isoformat()}")
+    
+    # Capture the same fields the bot requests in
+    # bot_lib.fetch_bitcoin_mining_articles (title, body, url, date, source,
+    # image, sentiment, socialScore) instead of the provider's defaults
+    return_info = ReturnInfo(
+        articleInfo=ArticleInfoFlags(socialScore=True, eventUri=False, authors=False)
+    )
+    
+    # Define the output file path
+    output_filename = "raw_articles.jsonl"
     
-    # Get the raw data from the provider
-    raw_articles_data = provider.fetch_raw_articles(start_date, end_date)
+    # Stream the raw data to the file, one JSON object per line (orjson emits
+    # UTF-8 bytes directly; the stdlib encoder is the fallback)
+    count = 0
+    with open(output_filename, 'wb', buffering=64 * 1024) as f:
+        for article in provider.iter_raw_articles(start_date, end_date, return_info):
+            if orjson is not None:
+                f.write(orjson.dumps(article, option=orjson.OPT_APPEND_NEWLINE))
+            else:
+                f.write((json.dumps(article, ensure_ascii=False) + "\n").encode('utf-8'))
+            count += 1
     
-    if raw_articles_data:
-        print(f"Successfully fetched {len(raw_articles_data)} articles.")
-        
-        # Define the output file path
-        output_filename = "raw_articles.json"
-        
-        # Save the raw data to a JSON file
-        with open(output_filename, 'w') as f:
-            json.dump(raw_articles_data, f, indent=4)
-        
+    if count:
+        print(f"Successfully fetched {count} articles.")
         print(f"Raw article data saved to {output_filename}")
     else:
+        os.remove(output_filename)
         print("No articles were fetched from Event Registry.")
 
 if __name__ == "__main__":
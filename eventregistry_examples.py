@@ -7,12 +7,22 @@ for fetching Bitcoin mining news articles.
 
 Usage:
     python eventregistry_examples.py
+    python eventregistry_examples.py --parallel   # run examples concurrently
+    ER_CACHE_DIR=/tmp/er_cache python eventregistry_examples.py   # cache results on disk
 """
 
+import functools
+import hashlib
 import os
 import json
+import random
+import sys
+import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
@@ -37,11 +47,102 @@ except ImportError:
 load_dotenv()
 API_KEY = os.getenv("EVENT_REGISTRY_API_KEY")
 
+# Optional on-disk cache for query results (set ER_CACHE_DIR to enable)
+CACHE_DIR = os.getenv("ER_CACHE_DIR")
+CACHE_TTL_SECONDS = int(os.getenv("ER_CACHE_TTL", "86400"))
+
+# Per-thread client storage (see get_client)
+_clients = threading.local()
+
+
+def get_client(api_key: str) -> "EventRegistry":
+    """
+    Return a shared EventRegistry client for the given API key.
+    
+    Creating the client once lets every example reuse the same HTTP session
+    (and its kept-alive TLS connection) instead of reconnecting each time.
+    Clients are kept per thread: EventRegistry holds a lock for the whole
+    duration of each request, so threads sharing one client would simply
+    queue up behind each other.
+    """
+    cache = getattr(_clients, "by_key", None)
+    if cache is None:
+        cache = _clients.by_key = {}
+    er = cache.get(api_key)
+    if er is None:
+        er = cache[api_key] = EventRegistry(apiKey=api_key)
+    return er
+
+
+def execute_query(er: "EventRegistry", q: "QueryArticlesIter", **kwargs) -> List[Dict]:
+    """
+    Run q.execQuery(er, **kwargs) and return the articles as a list.
+    
+    When ER_CACHE_DIR is set, results are stored there as JSON, keyed by a
+    hash of the query (q.queryParams, which includes dates and filters) and
+    the execQuery arguments, and reused for ER_CACHE_TTL seconds (default
+    one day). Repeated runs of the examples then skip the HTTP round trip
+    entirely.
+    """
+    if not CACHE_DIR:
+        return list(q.execQuery(er, **kwargs))
+    
+    key_source = json.dumps(
+        [type(q).__name__, q.queryParams, kwargs],
+        sort_keys=True,
+        default=lambda o: o.getConf() if hasattr(o, "getConf") else str(o),
+    )
+    key = hashlib.blake2b(key_source.encode(), digest_size=8).hexdigest()
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL_SECONDS:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # Missing, unreadable or stale entry - fetch again
+    
+    articles = list(q.execQuery(er, **kwargs))
+    
+    # Write to a temp file and rename it into place, so parallel runs never
+    # read a half-written entry
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(articles, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return articles
+
+
+def requires_eventregistry(default):
+    """
+    Replace an example with a stub returning `default` if eventregistry is
+    missing.
+    
+    The check happens once, when the module is loaded, so the examples
+    themselves carry no availability test.
+    """
+    def decorator(func):
+        if EVENTREGISTRY_AVAILABLE:
+            return func
+        
+        @functools.wraps(func)
+        def stub(*args, **kwargs):
+            print(f"Skipping {func.__name__} - eventregistry not installed")
+            return default
+        return stub
+    return decorator
+
 
 # =============================================================================
 # Example 1: Basic Article Search
 # =============================================================================
 
+@requires_eventregistry([])
 def example_basic_search(api_key: str) -> List[Dict]:
     """
     Basic article search using concept URI.
@@ -52,12 +153,8 @@ def example_basic_search(api_key: str) -> List[Dict]:
     print("Example 1: Basic Article Search")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
     # Initialize Event Registry client
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     # Create a simple query for Bitcoin articles
     q = QueryArticlesIter(
@@ -66,9 +163,7 @@ def example_basic_search(api_key: str) -> List[Dict]:
     )
     
     # Fetch up to 10 articles
-    articles = []
-    for article in q.execQuery(er, maxItems=10):
-        articles.append(article)
+    articles = execute_query(er, q, maxItems=10)
     
     print(f"Fetched {len(articles)} Bitcoin articles")
     
@@ -87,6 +182,7 @@ def example_basic_search(api_key: str) -> List[Dict]:
 # Example 2: Concept-Based Search with Multiple Concepts
 # =============================================================================
 
+@requires_eventregistry([])
 def example_concept_based_search(api_key: str) -> List[Dict]:
     """
     Search using multiple concepts with AND/OR logic.
@@ -97,11 +193,7 @@ def example_concept_based_search(api_key: str) -> List[Dict]:
     print("Example 2: Concept-Based Search")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     # Combine Bitcoin AND Mining concepts
     q = QueryArticlesIter(
@@ -112,9 +204,7 @@ def example_concept_based_search(api_key: str) -> List[Dict]:
         lang="eng"
     )
     
-    articles = []
-    for article in q.execQuery(er, sortBy="rel", maxItems=20):
-        articles.append(article)
+    articles = execute_query(er, q, sortBy="rel", maxItems=20)
     
     print(f"Fetched {len(articles)} Bitcoin mining articles")
     
@@ -125,6 +215,7 @@ def example_concept_based_search(api_key: str) -> List[Dict]:
 # Example 3: Using QueryArticlesIter for Large Result Sets
 # =============================================================================
 
+@requires_eventregistry([])
 def example_pagination_iterator(api_key: str) -> List[Dict]:
     """
     Use QueryArticlesIter for efficient pagination through large result sets.
@@ -136,15 +227,12 @@ def example_pagination_iterator(api_key: str) -> List[Dict]:
     print("Example 3: Pagination with Iterator")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     # Query for articles from the last 7 days
-    date_end = datetime.now().strftime("%Y-%m-%d")
-    date_start = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    today = datetime.now(timezone.utc).date()
+    date_end = today.isoformat()
+    date_start = (today - timedelta(days=7)).isoformat()
     
     q = QueryArticlesIter(
         conceptUri=QueryItems.AND([
@@ -161,7 +249,7 @@ def example_pagination_iterator(api_key: str) -> List[Dict]:
     batch_size = 25
     processed = 0
     
-    for article in q.execQuery(er, sortBy="date", maxItems=100):
+    for article in execute_query(er, q, sortBy="date", maxItems=100):
         articles.append(article)
         processed += 1
         
@@ -178,6 +266,7 @@ def example_pagination_iterator(api_key: str) -> List[Dict]:
 # Example 4: Configuring ReturnInfo for Different Use Cases
 # =============================================================================
 
+@requires_eventregistry([])
 def example_return_info_minimal(api_key: str) -> List[Dict]:
     """
     Configure minimal return info for fast filtering.
@@ -189,11 +278,7 @@ def example_return_info_minimal(api_key: str) -> List[Dict]:
     print("Example 4a: Minimal ReturnInfo")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     q = QueryArticlesIter(
         conceptUri="http://en.wikipedia.org/wiki/Bitcoin",
@@ -203,15 +288,15 @@ def example_return_info_minimal(api_key: str) -> List[Dict]:
     # Note: QueryArticlesIter returns all fields by default
     # No need to call setRequestedResult() as it's not supported
     
-    articles = []
-    for article in q.execQuery(er, maxItems=10):
-        articles.append(article)
-        print(f"  Title: {article.get('title', 'N/A')[:60]}...")
+    articles = execute_query(er, q, maxItems=10)
+    for article in articles:
+        print(f"  Title: {article.get('title', 'N/A'):.60}...")
         print(f"  Source: {article.get('source', {}).get('title', 'N/A')}")
     
     return articles
 
 
+@requires_eventregistry([])
 def example_return_info_social_media(api_key: str) -> List[Dict]:
     """
     Configure return info for social media posting.
@@ -223,11 +308,7 @@ def example_return_info_social_media(api_key: str) -> List[Dict]:
     print("Example 4b: Social Media ReturnInfo")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     q = QueryArticlesIter(
         conceptUri=QueryItems.AND([
@@ -240,9 +321,8 @@ def example_return_info_social_media(api_key: str) -> List[Dict]:
     # Note: QueryArticlesIter returns all fields by default
     # No need to call setRequestedResult() as it's not supported
     
-    articles = []
-    for article in q.execQuery(er, sortBy="socialScore", maxItems=10):
-        articles.append(article)
+    articles = execute_query(er, q, sortBy="socialScore", maxItems=10)
+    for article in articles:
         print(f"\n  Title: {article.get('title', 'N/A')}")
         print(f"  Social Score: {article.get('socialScore', 0)}")
         print(f"  Sentiment: {article.get('sentiment', 0)}")
@@ -251,6 +331,7 @@ def example_return_info_social_media(api_key: str) -> List[Dict]:
     return articles
 
 
+@requires_eventregistry([])
 def example_return_info_comprehensive(api_key: str) -> List[Dict]:
     """
     Configure comprehensive return info for detailed analysis.
@@ -261,11 +342,7 @@ def example_return_info_comprehensive(api_key: str) -> List[Dict]:
     print("Example 4c: Comprehensive ReturnInfo")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     q = QueryArticlesIter(
         conceptUri="http://en.wikipedia.org/wiki/Bitcoin",
@@ -275,9 +352,8 @@ def example_return_info_comprehensive(api_key: str) -> List[Dict]:
     # Note: QueryArticlesIter returns all fields by default
     # No need to call setRequestedResult() as it's not supported
     
-    articles = []
-    for article in q.execQuery(er, maxItems=5):
-        articles.append(article)
+    articles = execute_query(er, q, maxItems=5)
+    for article in articles:
         print(f"\n  Title: {article.get('title', 'N/A')}")
         print(f"  Authors: {len(article.get('authors', []))} author(s)")
         print(f"  Concepts: {len(article.get('concepts', []))} concept(s)")
@@ -290,6 +366,7 @@ def example_return_info_comprehensive(api_key: str) -> List[Dict]:
 # Example 5: Filtering by Source, Language, and Sentiment
 # =============================================================================
 
+@requires_eventregistry([])
 def example_filtering_by_source(api_key: str) -> List[Dict]:
     """
     Filter articles by specific news sources.
@@ -300,11 +377,7 @@ def example_filtering_by_source(api_key: str) -> List[Dict]:
     print("Example 5a: Filtering by Source")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     # Include only specific high-quality sources
     q = QueryArticlesIter(
@@ -313,16 +386,16 @@ def example_filtering_by_source(api_key: str) -> List[Dict]:
         lang="eng"
     )
     
-    articles = []
-    for article in q.execQuery(er, maxItems=10):
-        articles.append(article)
+    articles = execute_query(er, q, maxItems=10)
+    for article in articles:
         source = article.get('source', {}).get('title', 'Unknown')
-        print(f"  {article.get('title', 'N/A')[:60]}...")
+        print(f"  {article.get('title', 'N/A'):.60}...")
         print(f"    Source: {source}")
     
     return articles
 
 
+@requires_eventregistry([])
 def example_filtering_multiple_languages(api_key: str) -> List[Dict]:
     """
     Fetch articles in multiple languages.
@@ -333,11 +406,7 @@ def example_filtering_multiple_languages(api_key: str) -> List[Dict]:
     print("Example 5b: Multiple Languages")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     # English, Spanish, and French
     q = QueryArticlesIter(
@@ -345,55 +414,50 @@ def example_filtering_multiple_languages(api_key: str) -> List[Dict]:
         lang=["eng", "spa", "fra"]
     )
     
-    articles = []
-    for article in q.execQuery(er, maxItems=15):
-        articles.append(article)
+    articles = execute_query(er, q, maxItems=15)
     
     print(f"Fetched {len(articles)} articles in multiple languages")
     
     return articles
 
 
+@requires_eventregistry([])
 def example_filtering_by_sentiment(api_key: str) -> List[Dict]:
     """
     Filter articles by sentiment (positive/negative).
     
-    Demonstrates manual filtering based on sentiment score.
+    Demonstrates server-side filtering with minSentiment/maxSentiment, so
+    each bucket only downloads the articles that belong in it.
     """
     print("\n" + "="*80)
     print("Example 5c: Filtering by Sentiment")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
-    
-    q = QueryArticlesIter(
-        conceptUri=QueryItems.AND([
-            "http://en.wikipedia.org/wiki/Bitcoin",
-            "http://en.wikipedia.org/wiki/Mining"
-        ]),
-        lang="eng"
-    )
-    
-    # Note: QueryArticlesIter returns all fields by default
-    # No need to call setRequestedResult() as it's not supported
-    
-    positive_articles = []
-    neutral_articles = []
-    negative_articles = []
-    
-    for article in q.execQuery(er, maxItems=50):
-        sentiment = article.get('sentiment', 0)
-        
-        if sentiment > 0.2:
-            positive_articles.append(article)
-        elif sentiment < -0.2:
-            negative_articles.append(article)
-        else:
-            neutral_articles.append(article)
+    er = get_client(api_key)
+    
+    # Note: setting minSentiment/maxSentiment drops articles that have no
+    # sentiment score (sentiment is only computed for English articles)
+    sentiment_ranges = {
+        "positive": {"minSentiment": 0.2},
+        "neutral": {"minSentiment": -0.2, "maxSentiment": 0.2},
+        "negative": {"maxSentiment": -0.2},
+    }
+    
+    buckets = {}
+    for label, sentiment_range in sentiment_ranges.items():
+        q = QueryArticlesIter(
+            conceptUri=QueryItems.AND([
+                "http://en.wikipedia.org/wiki/Bitcoin",
+                "http://en.wikipedia.org/wiki/Mining"
+            ]),
+            lang="eng",
+            **sentiment_range
+        )
+        buckets[label] = execute_query(er, q, maxItems=50)
+    
+    positive_articles = buckets["positive"]
+    neutral_articles = buckets["neutral"]
+    negative_articles = buckets["negative"]
     
     print(f"Positive articles: {len(positive_articles)}")
     print(f"Neutral articles: {len(neutral_articles)}")
@@ -406,6 +470,7 @@ def example_filtering_by_sentiment(api_key: str) -> List[Dict]:
 # Example 6: Sorting Strategies
 # =============================================================================
 
+@requires_eventregistry([])
 def example_sorting_by_date(api_key: str) -> List[Dict]:
     """
     Sort articles by publication date (newest first).
@@ -416,25 +481,21 @@ def example_sorting_by_date(api_key: str) -> List[Dict]:
     print("Example 6a: Sort by Date")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     q = QueryArticlesIter(
         conceptUri="http://en.wikipedia.org/wiki/Bitcoin",
         lang="eng"
     )
     
-    articles = []
-    for article in q.execQuery(er, sortBy="date", maxItems=10):
-        articles.append(article)
-        print(f"  {article.get('date', 'N/A')}: {article.get('title', 'N/A')[:60]}...")
+    articles = execute_query(er, q, sortBy="date", maxItems=10)
+    for article in articles:
+        print(f"  {article.get('date', 'N/A')}: {article.get('title', 'N/A'):.60}...")
     
     return articles
 
 
+@requires_eventregistry([])
 def example_sorting_by_social_score(api_key: str) -> List[Dict]:
     """
     Sort by social media engagement (most viral first).
@@ -445,11 +506,7 @@ def example_sorting_by_social_score(api_key: str) -> List[Dict]:
     print("Example 6b: Sort by Social Score")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     q = QueryArticlesIter(
         conceptUri=QueryItems.AND([
@@ -462,15 +519,15 @@ def example_sorting_by_social_score(api_key: str) -> List[Dict]:
     # Note: QueryArticlesIter returns all fields by default
     # No need to call setRequestedResult() as it's not supported
     
-    articles = []
-    for article in q.execQuery(er, sortBy="socialScore", maxItems=10):
-        articles.append(article)
+    articles = execute_query(er, q, sortBy="socialScore", maxItems=10)
+    for article in articles:
         score = article.get('socialScore', 0)
-        print(f"  Score {score}: {article.get('title', 'N/A')[:60]}...")
+        print(f"  Score {score}: {article.get('title', 'N/A'):.60}...")
     
     return articles
 
 
+@requires_eventregistry([])
 def example_sorting_by_source_importance(api_key: str) -> List[Dict]:
     """
     Sort by source authority/reputation.
@@ -481,22 +538,17 @@ def example_sorting_by_source_importance(api_key: str) -> List[Dict]:
     print("Example 6c: Sort by Source Importance")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     q = QueryArticlesIter(
         conceptUri="http://en.wikipedia.org/wiki/Bitcoin",
         lang="eng"
     )
     
-    articles = []
-    for article in q.execQuery(er, sortBy="sourceImportance", maxItems=10):
-        articles.append(article)
+    articles = execute_query(er, q, sortBy="sourceImportance", maxItems=10)
+    for article in articles:
         source = article.get('source', {}).get('title', 'Unknown')
-        print(f"  {source}: {article.get('title', 'N/A')[:60]}...")
+        print(f"  {source}: {article.get('title', 'N/A'):.60}...")
     
     return articles
 
@@ -505,6 +557,7 @@ def example_sorting_by_source_importance(api_key: str) -> List[Dict]:
 # Example 7: Recent Activity Monitoring
 # =============================================================================
 
+@requires_eventregistry([])
 def example_recent_activity_monitoring(api_key: str) -> List[Dict]:
     """
     Monitor recent Bitcoin mining activity (last 24 hours).
@@ -515,15 +568,12 @@ def example_recent_activity_monitoring(api_key: str) -> List[Dict]:
     print("Example 7: Recent Activity Monitoring")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     # Last 24 hours
-    date_end = datetime.now().strftime("%Y-%m-%d")
-    date_start = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    today = datetime.now(timezone.utc).date()
+    date_end = today.isoformat()
+    date_start = (today - timedelta(days=1)).isoformat()
     
     q = QueryArticlesIter(
         conceptUri=QueryItems.AND([
@@ -537,16 +587,14 @@ def example_recent_activity_monitoring(api_key: str) -> List[Dict]:
         isDuplicateFilter="skipDuplicates"
     )
     
-    articles = []
-    for article in q.execQuery(er, sortBy="date", maxItems=25):
-        articles.append(article)
+    articles = execute_query(er, q, sortBy="date", maxItems=25)
     
     print(f"Found {len(articles)} articles in the last 24 hours")
     
     if articles:
         print("\nMost recent:")
         for article in articles[:5]:
-            print(f"  {article.get('date', 'N/A')} - {article.get('title', 'N/A')[:60]}...")
+            print(f"  {article.get('date', 'N/A')} - {article.get('title', 'N/A'):.60}...")
     
     return articles
 
@@ -555,6 +603,7 @@ def example_recent_activity_monitoring(api_key: str) -> List[Dict]:
 # Example 8: Getting Trending Concepts
 # =============================================================================
 
+@requires_eventregistry([])
 def example_trending_concepts(api_key: str) -> List[str]:
     """
     Find trending concepts related to Bitcoin mining.
@@ -565,11 +614,7 @@ def example_trending_concepts(api_key: str) -> List[str]:
     print("Example 8: Trending Concepts")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     # Fetch articles and extract concepts
     q = QueryArticlesIter(
@@ -580,21 +625,24 @@ def example_trending_concepts(api_key: str) -> List[str]:
         lang="eng"
     )
     
-    # Note: QueryArticlesIter returns all fields by default
-    # No need to call setRequestedResult() as it's not supported
+    # Concepts are not included by default; body isn't needed here
+    return_info = ReturnInfo(articleInfo=ArticleInfoFlags(concepts=True, body=False))
     
     # Count concept frequencies
-    concept_counts = {}
-    
-    for article in q.execQuery(er, maxItems=100):
-        concepts = article.get('concepts', [])
-        for concept in concepts:
-            label = concept.get('label', {}).get('eng', '')
-            if label:
-                concept_counts[label] = concept_counts.get(label, 0) + 1
+    concept_counts = Counter()
+    
+    for article in execute_query(er, q, returnInfo=return_info, maxItems=100):
+        concept_counts.update(
+            label
+            for label in (
+                (concept.get('label') or {}).get('eng')
+                for concept in article.get('concepts') or ()
+            )
+            if label
+        )
     
     # Sort by frequency
-    trending = sorted(concept_counts.items(), key=lambda x: x[1], reverse=True)
+    trending = concept_counts.most_common()
     
     print("\nTop 10 trending concepts:")
     for concept, count in trending[:10]:
@@ -607,6 +655,11 @@ def example_trending_concepts(api_key: str) -> List[str]:
 # Example 9: Error Handling and Retry Logic
 # =============================================================================
 
+# Rate-limit backoff schedule in seconds, indexed by attempt
+RATE_LIMIT_BACKOFF = (10.0, 20.0, 40.0)
+
+
+@requires_eventregistry(None)
 def example_error_handling(api_key: str) -> Optional[List[Dict]]:
     """
     Demonstrate proper error handling and retry logic.
@@ -617,24 +670,18 @@ def example_error_handling(api_key: str) -> Optional[List[Dict]]:
     print("Example 9: Error Handling and Retry Logic")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return None
-    
     max_retries = 3
     
     for attempt in range(max_retries):
         try:
-            er = EventRegistry(apiKey=api_key)
+            er = get_client(api_key)
             
             q = QueryArticlesIter(
                 conceptUri="http://en.wikipedia.org/wiki/Bitcoin",
                 lang="eng"
             )
             
-            articles = []
-            for article in q.execQuery(er, maxItems=10):
-                articles.append(article)
+            articles = execute_query(er, q, maxItems=10)
             
             print(f"✓ Successfully fetched {len(articles)} articles")
             return articles
@@ -648,8 +695,10 @@ def example_error_handling(api_key: str) -> Optional[List[Dict]]:
             
             elif "rate limit" in error_msg:
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) * 10
-                    print(f"⚠ Rate limit hit, waiting {wait_time}s...")
+                    # Jitter spreads out retries from concurrent workers
+                    backoff = RATE_LIMIT_BACKOFF[attempt]
+                    wait_time = backoff + random.uniform(0, backoff * 0.25)
+                    print(f"⚠ Rate limit hit, waiting {wait_time:.1f}s...")
                     time.sleep(wait_time)
                 else:
                     print("✗ Error: Rate limit exceeded after max retries")
@@ -659,7 +708,7 @@ def example_error_handling(api_key: str) -> Optional[List[Dict]]:
                 print(f"✗ Error: {e}")
                 if attempt == max_retries - 1:
                     return None
-                time.sleep(5)
+                time.sleep(5 + random.uniform(0, 1.25))
     
     return None
 
@@ -668,6 +717,7 @@ def example_error_handling(api_key: str) -> Optional[List[Dict]]:
 # Example 10: Complete Bitcoin Mining News Fetcher
 # =============================================================================
 
+@requires_eventregistry([])
 def example_complete_fetcher(api_key: str) -> List[Dict]:
     """
     Complete example: Fetch, filter, and process Bitcoin mining news.
@@ -678,17 +728,17 @@ def example_complete_fetcher(api_key: str) -> List[Dict]:
     print("Example 10: Complete Bitcoin Mining News Fetcher")
     print("="*80)
     
-    if not EVENTREGISTRY_AVAILABLE:
-        print("Skipping - eventregistry not installed")
-        return []
-    
-    er = EventRegistry(apiKey=api_key)
+    er = get_client(api_key)
     
     # Date range: last 7 days
-    date_end = datetime.now().strftime("%Y-%m-%d")
-    date_start = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    today = datetime.now(timezone.utc).date()
+    date_end = today.isoformat()
+    date_start = (today - timedelta(days=7)).isoformat()
     
-    # Build query
+    blacklisted_sources = ["example-spam.com", "low-quality.com"]
+    
+    # Build query - blacklisted sources and very negative sentiment are
+    # filtered by the API, so those articles are never downloaded
     q = QueryArticlesIter(
         conceptUri=QueryItems.AND([
             "http://en.wikipedia.org/wiki/Bitcoin",
@@ -701,6 +751,8 @@ def example_complete_fetcher(api_key: str) -> List[Dict]:
             "mining rig",
             "difficulty"
         ]),
+        ignoreSourceUri=QueryItems.OR(blacklisted_sources),
+        minSentiment=-0.5,
         dateStart=date_start,
         dateEnd=date_end,
         lang="eng",
@@ -710,26 +762,13 @@ def example_complete_fetcher(api_key: str) -> List[Dict]:
     # Note: QueryArticlesIter returns all fields by default
     # No need to call setRequestedResult() as it's not supported
     
-    # Fetch articles
+    # Fetch articles, requiring a title and URL
     print("Fetching articles...")
-    articles = []
-    blacklisted_sources = ["example-spam.com", "low-quality.com"]
-    
-    for article in q.execQuery(er, sortBy="socialScore", maxItems=100):
-        # Filter out blacklisted sources
-        source_uri = article.get('source', {}).get('uri', '')
-        if source_uri in blacklisted_sources:
-            continue
-        
-        # Filter by quality (require title and URL)
-        if not article.get('title') or not article.get('url'):
-            continue
-        
-        # Filter very negative sentiment
-        if article.get('sentiment', 0) < -0.5:
-            continue
-        
-        articles.append(article)
+    articles = [
+        article
+        for article in execute_query(er, q, sortBy="socialScore", maxItems=100)
+        if article.get('title') and article.get('url')
+    ]
     
     print(f"Fetched {len(articles)} high-quality articles")
     
@@ -751,6 +790,32 @@ def example_complete_fetcher(api_key: str) -> List[Dict]:
 # Main Function - Run All Examples
 # =============================================================================
 
+def run_examples_parallel(api_key: str, examples: List, max_workers: int = 4) -> List:
+    """
+    Run independent examples concurrently in a thread pool.
+    
+    The examples are I/O bound (each one waits 1-3s on Event Registry), so
+    running them side by side brings the total wall time close to the slowest
+    example rather than the sum of all of them. Every worker thread gets its
+    own client from get_client(). max_workers also caps how many requests
+    are in flight against the API at once.
+    
+    Printed output from different examples will interleave.
+    
+    Returns:
+        List of (name, result, error) tuples in the order of `examples`
+    """
+    def run(example):
+        name, func = example
+        try:
+            return name, func(api_key), None
+        except Exception as e:
+            return name, None, e
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, examples))
+
+
 def main():
     """Run all examples."""
     print("\n" + "="*80)
@@ -793,13 +858,24 @@ def main():
         ("Complete Fetcher", example_complete_fetcher),
     ]
     
-    # Run each example
-    for name, func in examples:
-        try:
-            func(API_KEY)
-            time.sleep(1)  # Rate limiting between examples
-        except Exception as e:
-            print(f"\n✗ Error in {name}: {e}")
+    # Buffer the many small prints instead of writing each line to the
+    # terminal; output is flushed once per example below
+    sys.stdout.reconfigure(line_buffering=False)
+    
+    # Run each example (pass --parallel to run them concurrently)
+    if "--parallel" in sys.argv[1:]:
+        for name, _, error in run_examples_parallel(API_KEY, examples):
+            if error is not None:
+                print(f"\n✗ Error in {name}: {error}")
+    else:
+        # No sleep needed between examples: the client already enforces a
+        # minimum delay between requests
+        for name, func in examples:
+            try:
+                func(API_KEY)
+            except Exception as e:
+                print(f"\n✗ Error in {name}: {e}")
+            sys.stdout.flush()
     
     print("\n" + "="*80)
     print("All examples completed!")
@@ -61,7 +61,7 @@ def example_1_fetch_images():
             print(f"{i}. {image.get('description') or image.get('alt_description', 'No description')}")
             print(f"   Photographer: {image['photographer']}")
             print(f"   Dimensions: {image['width']}x{image['height']}")
-            print(f"   URL: {image['url'][:60]}...")
+            print(f"   URL: {image['url']:.60}...")
             print()
         
         return images
@@ -235,7 +235,7 @@ def example_4_article_with_images():
         article = articles[0]
         title = article.get('title', 'No title')
         
-        print(f"\nTop Article: {title[:60]}...")
+        print(f"\nTop Article: {title:.60}...")
         print(f"Social Score: {article.get('socialScore', 0)}")
         
         # Fetch matching images based on article
@@ -254,7 +254,7 @@ def example_4_article_with_images():
         if image_paths:
             print(f"✓ Prepared {len(image_paths)} matching images")
             print("\nReady to post:")
-            print(f"  Article: {title[:60]}...")
+            print(f"  Article: {title:.60}...")
             print(f"  Images: {len(image_paths)}")
             print(f"\nExample tweet content:")
             print(f"  🚀 {title[:200]}...")
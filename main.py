@@ -13,12 +13,19 @@ Usage:
 """
 
 import argparse
-import json
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from queue import SimpleQueue
+from typing import List, Dict, Optional
+
+import requests
 
 import config
 import bot_lib
@@ -28,13 +35,31 @@ import bot_lib
 # Logging Setup
 # =============================================================================
 
+# Log calls only enqueue the record; a background listener thread does the
+# formatting and the file/stdout writes so workflows don't block on I/O
+_log_formatter = logging.Formatter(config.LOG_FORMAT)
+_log_handlers = [
+    logging.FileHandler(config.LOG_FILE),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit
+
+# The queue handler only renders the message (plus any traceback); the
+# listener's handlers apply LOG_FORMAT
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=getattr(logging, config.LOG_LEVEL),
-    format=config.LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(config.LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[_queue_handler]
 )
 
 logger = logging.getLogger(__name__)
@@ -45,7 +70,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 def load_json_file(filepath: str, default=None) -> any:
-    """Load data from JSON file."""
+    """Load data from JSON file (parsed with orjson when installed)."""
     if default is None:
         default = []
     
@@ -53,57 +78,175 @@ def load_json_file(filepath: str, default=None) -> any:
         return default
     
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return bot_lib.load_articles_from_json(filepath)
     except Exception as e:
         logger.error(f"Error loading {filepath}: {e}")
         return default
 
 
 def save_json_file(filepath: str, data: any) -> bool:
-    """Save data to JSON file."""
+    """Save data to JSON file (serialized with orjson when installed)."""
     try:
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        bot_lib.save_articles_to_json(data, filepath)
         return True
     except Exception as e:
         logger.error(f"Error saving {filepath}: {e}")
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def get_github_session() -> requests.Session:
+    """
+    Get the pooled, authenticated session used for GitHub API calls.
+    
+    Created once per process so every GitHub request reuses the same
+    connection and default headers. POSTs are retried on 429/503, so a
+    GitHub blip doesn't throw away an already-generated daily brief.
+    """
+    session = bot_lib.create_http_session(pool_maxsize=4, max_retries=5, retry_post=True)
+    session.headers.update({
+        'Authorization': f'token {config.GITHUB_TOKEN}',
+        'Accept': 'application/vnd.github.v3+json'
+    })
+    return session
+
+
+@functools.lru_cache(maxsize=4)
+def get_gemini_model(model_name: str = 'gemini-pro'):
+    """
+    Get a configured Gemini model, created once per process and model name.
+    
+    The SDK is imported here rather than at module level: it is slow to
+    import and only the Gemini-backed workflows need it.
+    """
+    import google.generativeai as genai
+    
+    genai.configure(api_key=config.GEMINI_API_KEY)
+    return genai.GenerativeModel(model_name)
+
+
+def load_queue() -> deque:
+    """
+    Load the article queue as a deque bounded by MAX_QUEUE_SIZE.
+    
+    Appending to a full queue drops the oldest entry, and popping the next
+    article off the front is O(1).
+    """
+    return deque(load_json_file(config.QUEUE_FILE, default=[]), maxlen=config.MAX_QUEUE_SIZE)
+
+
+def save_queue(queue: deque) -> bool:
+    """Save the article queue."""
+    return save_json_file(config.QUEUE_FILE, list(queue))
+
+
+def migrate_legacy_posted_articles():
+    """
+    Import the old JSON-array posted log into the JSON Lines log, once.
+    
+    Runs when the .jsonl log is missing or empty and the legacy file still
+    exists, so the daily tweet limit and the monitor's posted-URL check
+    keep their history across the format change. The legacy file is
+    removed afterwards.
+    """
+    legacy = config.LEGACY_POSTED_ARTICLES_FILE
+    path = config.POSTED_ARTICLES_FILE
+    
+    if not os.path.exists(legacy):
+        return
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        return
+    
+    try:
+        posted = bot_lib.load_articles_from_json(legacy)
+        # The log is read newest-last (see get_posted_articles_today)
+        posted.sort(key=lambda p: p.get('date', ''))
+        bot_lib.save_articles_jsonl(posted, path)
+        os.remove(legacy)
+        logger.info(f"Migrated {len(posted)} entries from {legacy} to {path}")
+    except Exception as e:
+        logger.error(f"Error migrating {legacy}: {e}")
+
+
+def load_posted_articles() -> List[Dict]:
+    """Load the posted-articles log (JSON Lines, oldest first)."""
+    if not os.path.exists(config.POSTED_ARTICLES_FILE):
+        return []
+    
+    try:
+        return list(bot_lib.iter_articles_jsonl(config.POSTED_ARTICLES_FILE))
+    except Exception as e:
+        logger.error(f"Error loading {config.POSTED_ARTICLES_FILE}: {e}")
+        return []
+
+
 def get_posted_articles_today() -> List[str]:
     """Get list of article URLs posted today."""
-    posted = load_json_file(config.POSTED_ARTICLES_FILE, default=[])
-    today = datetime.now().strftime("%Y-%m-%d")
+    if not os.path.exists(config.POSTED_ARTICLES_FILE):
+        return []
     
-    # Filter to only today's posts
-    today_posts = [
-        p for p in posted 
-        if p.get('date', '').startswith(today)
-    ]
+    today = date.today().isoformat()
+    
+    # The log is appended in date order, so walk it from the end and stop
+    # at the first entry from an earlier day
+    today_urls = []
+    try:
+        for p in bot_lib.iter_articles_jsonl_reverse(config.POSTED_ARTICLES_FILE):
+            if not p.get('date', '').startswith(today):
+                break
+            today_urls.append(p.get('url'))
+    except Exception as e:
+        logger.error(f"Error loading {config.POSTED_ARTICLES_FILE}: {e}")
     
-    return [p.get('url') for p in today_posts]
+    today_urls.reverse()
+    return today_urls
 
 
 def add_posted_article(url: str, tweet_id: str = None):
     """Record that an article has been posted."""
-    posted = load_json_file(config.POSTED_ARTICLES_FILE, default=[])
-    
-    posted.append({
+    now = datetime.now()
+    entry = {
         'url': url,
         'tweet_id': tweet_id,
-        'date': datetime.now().isoformat(),
-        'timestamp': datetime.now().timestamp()
-    })
+        'date': now.isoformat(),
+        'timestamp': now.timestamp()
+    }
     
-    # Keep only last 30 days
-    cutoff = datetime.now() - timedelta(days=30)
-    posted = [
-        p for p in posted 
-        if datetime.fromisoformat(p['date']) > cutoff
-    ]
+    try:
+        bot_lib.save_articles_jsonl([entry], config.POSTED_ARTICLES_FILE, append=True)
+    except Exception as e:
+        logger.error(f"Error saving {config.POSTED_ARTICLES_FILE}: {e}")
+        return
+    
+    compact_posted_articles()
+
+
+def compact_posted_articles(days: int = 30):
+    """
+    Drop posted-article entries older than `days` days.
+    
+    Only the first (oldest) entry is checked on each call; the file is
+    rewritten once that entry is more than a day past the cutoff, so the
+    log is compacted about once per day rather than on every post.
+    """
+    path = config.POSTED_ARTICLES_FILE
+    cutoff = (datetime.now() - timedelta(days=days)).isoformat()
     
-    save_json_file(config.POSTED_ARTICLES_FILE, posted)
+    try:
+        oldest = next(bot_lib.iter_articles_jsonl(path), None)
+        if oldest is None:
+            return
+        
+        # ISO 8601 timestamps compare correctly as strings
+        grace = (datetime.now() - timedelta(days=days + 1)).isoformat()
+        if oldest.get('date', '') >= grace:
+            return
+        
+        posted = [p for p in bot_lib.iter_articles_jsonl(path) if p.get('date', '') > cutoff]
+        bot_lib.save_articles_jsonl(posted, path)
+        logger.info(f"Compacted {path} to {len(posted)} entries")
+    except Exception as e:
+        logger.error(f"Error compacting {path}: {e}")
 
 
 # =============================================================================
@@ -133,8 +276,8 @@ def workflow_monitor():
     end_date = datetime.now()
     start_date = end_date - timedelta(hours=config.MONITOR_HOURS_BACK)
     
-    date_start = start_date.strftime("%Y-%m-%d")
-    date_end = end_date.strftime("%Y-%m-%d")
+    date_start = start_date.date().isoformat()
+    date_end = end_date.date().isoformat()
     
     logger.info(f"Fetching articles from {date_start} to {date_end}")
     
@@ -150,6 +293,18 @@ def workflow_monitor():
         
         logger.info(f"Fetched {len(articles)} articles from Event Registry")
         
+        if not articles:
+            logger.info("No new articles found")
+            return 0
+        
+        # Drop articles that are already queued or were posted recently
+        # before running the content filters over their bodies. URLs are
+        # compared in the same canonical form remove_duplicate_articles() uses
+        queue = load_queue()
+        seen_urls = {bot_lib.canonical_url(item['url']) for item in queue}
+        seen_urls.update(bot_lib.canonical_url(p['url']) for p in load_posted_articles() if p.get('url'))
+        articles = [a for a in articles if bot_lib.canonical_url(a.get('url', '')) not in seen_urls]
+        
         if not articles:
             logger.info("No new articles found")
             return 0
@@ -171,16 +326,17 @@ def workflow_monitor():
         
         # Remove duplicates
         unique_articles = bot_lib.remove_duplicate_articles(filtered_articles)
+        # Also compare against the queue: the URL pre-skip above only drops
+        # the queued copy itself, not syndicated copies under other URLs
+        unique_articles = bot_lib.remove_near_duplicate_articles(unique_articles, seen=queue)
         logger.info(f"Removed duplicates, {len(unique_articles)} unique articles")
         
-        # Load existing queue
-        queue = load_json_file(config.QUEUE_FILE, default=[])
-        queue_urls = {item['url'] for item in queue}
-        
-        # Add new articles to queue
+        # Add new articles to queue (the deque drops the oldest entries
+        # once it reaches MAX_QUEUE_SIZE)
+        queued_before = len(queue)
         new_count = 0
         for article in unique_articles:
-            if article.get('url') not in queue_urls:
+            if bot_lib.canonical_url(article.get('url', '')) not in seen_urls:
                 queue.append({
                     'url': article['url'],
                     'title': article['title'],
@@ -194,23 +350,24 @@ def workflow_monitor():
         
         logger.info(f"Added {new_count} new articles to queue")
         
-        # Limit queue size
-        if len(queue) > config.MAX_QUEUE_SIZE:
-            queue = queue[-config.MAX_QUEUE_SIZE:]
+        if queued_before + new_count > len(queue):
             logger.info(f"Trimmed queue to {config.MAX_QUEUE_SIZE} articles")
         
         # Save queue
-        save_json_file(config.QUEUE_FILE, queue)
+        save_queue(queue)
         
         # Cache articles for daily brief
         cache = load_json_file(config.DAILY_BRIEF_CACHE, default=[])
         cache.extend(unique_articles)
         
-        # Keep only last 24 hours
-        cutoff = datetime.now() - timedelta(hours=24)
+        # Keep only last 24 hours (ISO 8601 strings compare in date order,
+        # and a date-only value sorts like midnight of that day)
+        now = datetime.now()
+        cutoff = (now - timedelta(hours=24)).isoformat()
+        now_iso = now.isoformat()
         cache = [
             a for a in cache 
-            if datetime.fromisoformat(a.get('date', datetime.now().isoformat())) > cutoff
+            if a.get('date', now_iso) > cutoff
         ]
         
         save_json_file(config.DAILY_BRIEF_CACHE, cache)
@@ -228,6 +385,41 @@ def workflow_monitor():
 # Workflow 2: Post (Generate and Post Tweets)
 # =============================================================================
 
+def fetch_tweet_image() -> Optional[str]:
+    """
+    Fetch and prepare an Unsplash image for a tweet.
+    
+    Returns:
+        Path to the optimized image, or None if it couldn't be fetched
+    """
+    try:
+        logger.info("Fetching and preparing image...")
+        
+        # Create image cache directory
+        os.makedirs(config.IMAGE_CACHE_DIR, exist_ok=True)
+        
+        # Generate image query based on article
+        image_query = "bitcoin mining"  # Simple default
+        
+        # Fetch and prepare images
+        image_paths = bot_lib.fetch_and_prepare_images(
+            unsplash_access_key=config.UNSPLASH_ACCESS_KEY,
+            query=image_query,
+            output_dir=config.IMAGE_CACHE_DIR,
+            count=1
+        )
+        
+        if image_paths:
+            logger.info(f"Image ready: {image_paths[0]}")
+            return image_paths[0]
+        
+    except Exception as e:
+        logger.warning(f"Could not fetch image: {e}")
+        # Continue without image
+    
+    return None
+
+
 def workflow_post():
     """
     Post Workflow: Generate and post a tweet from the queue.
@@ -264,62 +456,52 @@ def workflow_post():
         return 0
     
     # Load queue
-    queue = load_json_file(config.QUEUE_FILE, default=[])
+    queue = load_queue()
     
     if not queue:
         logger.info("Queue is empty, nothing to post")
         return 0
     
     # Get next article
-    article = queue.pop(0)
+    article = queue.popleft()
     logger.info(f"Processing article: {article['title']}")
     
+    # The image doesn't depend on the tweet text, so fetch it in the
+    # background while Gemini generates the tweet
+    executor = ThreadPoolExecutor(max_workers=1)
+    image_future = None
+    if config.UNSPLASH_ACCESS_KEY and article.get('image'):
+        image_future = executor.submit(fetch_tweet_image)
+    
     try:
-        # Generate tweet content
-        logger.info("Generating tweet with Gemini AI...")
-        
-        tweet_text = bot_lib.generate_social_media_content(
-            gemini_api_key=config.GEMINI_API_KEY,
-            article_title=article['title'],
-            article_body=article.get('body', ''),
-            max_length=config.MAX_TWEET_LENGTH - 25,  # Reserve space for URL
-            platform='twitter',
-            prompt_template=config.TWEET_GENERATION_PROMPT
-        )
+        # Reuse the tweet generated on a previous, failed attempt; articles
+        # are re-queued with it so a retry doesn't pay for another Gemini call
+        tweet_text = article.get('tweet_text')
         
-        if not tweet_text:
-            logger.error("Failed to generate tweet content")
-            return 1
+        if tweet_text:
+            logger.info(f"Reusing previously generated tweet: {tweet_text}")
+        else:
+            # Generate tweet content
+            logger.info("Generating tweet with Gemini AI...")
+            
+            tweet_text = bot_lib.generate_social_media_content(
+                gemini_api_key=config.GEMINI_API_KEY,
+                article_title=article['title'],
+                article_body=article.get('body', ''),
+                max_length=config.MAX_TWEET_LENGTH - 25,  # Reserve space for URL
+                platform='twitter',
+                prompt_template=config.TWEET_GENERATION_PROMPT
+            )
+            
+            if not tweet_text:
+                logger.error("Failed to generate tweet content")
+                return 1
+            
+            logger.info(f"Generated tweet: {tweet_text}")
+            article['tweet_text'] = tweet_text
         
-        logger.info(f"Generated tweet: {tweet_text}")
-        
-        # Optionally fetch image
-        image_path = None
-        if config.UNSPLASH_ACCESS_KEY and article.get('image'):
-            try:
-                logger.info("Fetching and preparing image...")
-                
-                # Create image cache directory
-                os.makedirs(config.IMAGE_CACHE_DIR, exist_ok=True)
-                
-                # Generate image query based on article
-                image_query = "bitcoin mining"  # Simple default
-                
-                # Fetch and prepare images
-                image_paths = bot_lib.fetch_and_prepare_images(
-                    unsplash_access_key=config.UNSPLASH_ACCESS_KEY,
-                    query=image_query,
-                    output_dir=config.IMAGE_CACHE_DIR,
-                    count=1
-                )
-                
-                if image_paths:
-                    image_path = image_paths[0]
-                    logger.info(f"Image ready: {image_path}")
-                
-            except Exception as e:
-                logger.warning(f"Could not fetch image: {e}")
-                # Continue without image
+        # Wait for the image started alongside tweet generation
+        image_path = image_future.result() if image_future else None
         
         # Post to Twitter
         logger.info("Posting to Twitter...")
@@ -341,29 +523,56 @@ def workflow_post():
             add_posted_article(article['url'], tweet_id)
             
             # Save updated queue
-            save_json_file(config.QUEUE_FILE, queue)
+            save_queue(queue)
             
             logger.info("Post workflow completed successfully")
             return 0
         else:
             logger.error("Failed to post tweet")
             # Re-add article to queue
-            queue.insert(0, article)
-            save_json_file(config.QUEUE_FILE, queue)
+            queue.appendleft(article)
+            save_queue(queue)
             return 1
             
     except Exception as e:
         logger.error(f"Error in post workflow: {e}", exc_info=True)
         # Re-add article to queue
-        queue.insert(0, article)
-        save_json_file(config.QUEUE_FILE, queue)
+        queue.appendleft(article)
+        save_queue(queue)
         return 1
+    finally:
+        # On every exit path: drop a download that hasn't started and wait
+        # for one in progress, so it can't outlive the workflow
+        # (fetch_tweet_image() logs its own errors)
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 # =============================================================================
 # Workflow 3: Daily Brief (Generate Daily Report)
 # =============================================================================
 
+def format_brief_articles(articles: List[Dict]) -> str:
+    """
+    Format cached articles as the Markdown list used in the brief prompt.
+    
+    Duplicate URLs are dropped, titles are truncated, and the list stops at
+    BRIEF_PROMPT_MAX_ARTICLES entries or BRIEF_PROMPT_MAX_CHARS characters,
+    whichever comes first, to bound the prompt size.
+    """
+    pieces = []
+    total = 0
+    
+    for a in bot_lib.remove_duplicate_articles(articles)[:config.BRIEF_PROMPT_MAX_ARTICLES]:
+        title = a['title'][:config.BRIEF_TITLE_MAX_CHARS]
+        line = f"- **{title}**\n  Source: {a.get('source', {}).get('title', 'Unknown')}\n  URL: {a['url']}"
+        if total + len(line) > config.BRIEF_PROMPT_MAX_CHARS:
+            break
+        pieces.append(line)
+        total += len(line) + 2  # Separator
+    
+    return "\n\n".join(pieces)
+
+
 def workflow_daily_brief():
     """
     Daily Brief Workflow: Generate comprehensive daily report.
@@ -398,19 +607,12 @@ def workflow_daily_brief():
     
     try:
         # Format articles for prompt
-        articles_text = "\n\n".join([
-            f"- **{a['title']}**\n  Source: {a.get('source', {}).get('title', 'Unknown')}\n  URL: {a['url']}"
-            for a in articles[:50]  # Limit to top 50 articles
-        ])
+        articles_text = format_brief_articles(articles)
         
         # Generate brief with Gemini
         logger.info("Generating brief with Gemini AI...")
         
-        # Use Gemini API to generate brief
-        import google.generativeai as genai
-        
-        genai.configure(api_key=config.GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-pro')
+        model = get_gemini_model()
         
         prompt = config.DAILY_BRIEF_PROMPT.format(articles=articles_text)
         response = model.generate_content(prompt)
@@ -421,16 +623,9 @@ def workflow_daily_brief():
         # Create GitHub issue
         logger.info("Creating GitHub issue...")
         
-        import requests
-        
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = date.today().isoformat()
         issue_title = f"Bitcoin Mining Daily Brief - {today}"
         
-        headers = {
-            'Authorization': f'token {config.GITHUB_TOKEN}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        
         data = {
             'title': issue_title,
             'body': brief_content,
@@ -440,7 +635,7 @@ def workflow_daily_brief():
         owner, repo = config.GITHUB_REPO.split('/')
         url = f'https://api.github.com/repos/{owner}/{repo}/issues'
         
-        response = requests.post(url, headers=headers, json=data)
+        response = get_github_session().post(url, json=data, timeout=30)
         
         if response.status_code == 201:
             issue_data = response.json()
@@ -502,6 +697,7 @@ Examples:
     workflow_func = workflows[args.workflow]
     
     try:
+        migrate_legacy_posted_articles()
         exit_code = workflow_func()
         sys.exit(exit_code)
     except KeyboardInterrupt:
@@ -6,7 +6,7 @@ including keyword-based relevance scoring to ensure articles are truly about
 Bitcoin mining and not just tangentially related.
 """
 
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Optional
 
 
 class BitcoinMiningFilter:
@@ -48,13 +48,22 @@ class BitcoinMiningFilter:
         Returns:
             Filtered list of articles that contain sufficient mining keywords
         """
-        filtered = []
+        return list(self.iter_filter(articles))
+    
+    def iter_filter(self, articles: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Lazily yield the articles that pass the mining relevance check.
         
-        for article in articles:
-            if self._is_mining_relevant(article):
-                filtered.append(article)
+        Use this instead of filter_articles() when the results are consumed
+        once, so no intermediate list is built.
         
-        return filtered
+        Args:
+            articles: Iterable of article dictionaries to filter
+            
+        Returns:
+            Iterator over articles that contain sufficient mining keywords
+        """
+        return (article for article in articles if self._is_mining_relevant(article))
     
     def _is_mining_relevant(self, article: Dict) -> bool:
         """
@@ -66,18 +75,29 @@ class BitcoinMiningFilter:
         Returns:
             True if the article contains at least min_mining_terms keywords
         """
-        # Combine title and body for checking
-        title = article.get('title', '').lower()
-        body = article.get('body', '').lower()
-        content = f"{title} {body}"
+        return self.is_mining_relevant_text(
+            article.get('title', '').lower(),
+            article.get('body', '').lower()
+        )
+    
+    def is_mining_relevant_text(self, title_lower: str, body_lower: str) -> bool:
+        """
+        Check relevance from an already-lowercased title and body.
         
-        # Count how many mining keywords appear in the content
-        keyword_count = 0
-        for keyword in self.MINING_KEYWORDS:
-            if keyword in content:
-                keyword_count += 1
+        Lets callers that have lowercased the text for their own checks
+        (e.g. bot_lib.filter_articles) reuse it instead of lowercasing the
+        article a second time.
         
-        return keyword_count >= self.min_mining_terms
+        Args:
+            title_lower: Article title, lowercased
+            body_lower: Article body, lowercased
+            
+        Returns:
+            True if the text contains at least min_mining_terms keywords
+        """
+        # Stop scanning as soon as the threshold is met
+        count = self._count_keywords(title_lower, body_lower, stop_at=self.min_mining_terms)
+        return count >= self.min_mining_terms
     
     def get_mining_keyword_count(self, article: Dict) -> int:
         """
@@ -89,13 +109,33 @@ class BitcoinMiningFilter:
         Returns:
             Number of mining keywords found in the article
         """
-        title = article.get('title', '').lower()
-        body = article.get('body', '').lower()
-        content = f"{title} {body}"
+        return self._count_keywords(
+            article.get('title', '').lower(),
+            article.get('body', '').lower()
+        )
+    
+    def _count_keywords(self, title_lower: str, body_lower: str, stop_at: Optional[int] = None) -> int:
+        """
+        Count the mining keywords found in a lowercased title and body.
         
+        Shared by is_mining_relevant_text() and get_mining_keyword_count().
+        Title and body are scanned separately to avoid copying the body
+        into a new combined string.
+        
+        Args:
+            title_lower: Article title, lowercased
+            body_lower: Article body, lowercased
+            stop_at: Return as soon as this many keywords have been found
+                    (None scans every keyword)
+            
+        Returns:
+            Number of distinct mining keywords found (at most stop_at)
+        """
         keyword_count = 0
         for keyword in self.MINING_KEYWORDS:
-            if keyword in content:
+            if keyword in title_lower or keyword in body_lower:
                 keyword_count += 1
+                if keyword_count == stop_at:
+                    break
         
         return keyword_count
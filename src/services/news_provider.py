@@ -1,16 +1,37 @@
 # ... existing code in EventRegistryProvider class
 
-    def fetch_raw_articles(self, start_date: datetime, end_date: datetime) -> list:
+    def fetch_raw_articles(self, start_date: datetime, end_date: datetime,
+                           return_info: Optional[ReturnInfo] = None) -> list:
         """
         Fetches the raw, unmodified article data from Event Registry.
 
         Args:
             start_date: The start date for the article search.
             end_date: The end date for the article search.
+            return_info: Fields to request; defaults to self.return_info.
+                Requesting only the fields you need shrinks the payload.
 
         Returns:
             A list of dictionaries, where each dictionary is the raw article data.
         """
+        return list(self.iter_raw_articles(start_date, end_date, return_info))
+
+    def iter_raw_articles(self, start_date: datetime, end_date: datetime,
+                          return_info: Optional[ReturnInfo] = None) -> Iterator[dict]:
+        """
+        Lazily yields raw article data from Event Registry, page by page.
+
+        Unlike fetch_raw_articles(), only the current result page is held in
+        memory, so callers can write each article out as it arrives.
+
+        Args:
+            start_date: The start date for the article search.
+            end_date: The end date for the article search.
+            return_info: Fields to request; defaults to self.return_info.
+
+        Yields:
+            Dictionaries of raw article data.
+        """
         q = QueryArticlesIter(
             conceptUri=self.er.getConceptUri("Bitcoin"),
             sourceUri=self.er.getConceptUri("Bitcoin"),
@@ -19,7 +40,6 @@
             lang="eng",
             sortBy="date"
         )
-        # Directly return the list of article data
-        return list(q.execQuery(self.er, returnInfo=self.return_info))
+        yield from q.execQuery(self.er, returnInfo=return_info or self.return_info)
 
 # ... rest of the file
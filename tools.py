@@ -12,9 +12,11 @@ Usage:
 """
 
 import argparse
-import json
+import os
 import sys
-from datetime import datetime, timedelta
+import traceback
+from collections import deque
+from datetime import date, datetime, timedelta
 
 import config
 import bot_lib
@@ -34,8 +36,8 @@ def cmd_test_fetch(args):
     end_date = datetime.now()
     start_date = end_date - timedelta(days=args.days)
     
-    date_start = start_date.strftime("%Y-%m-%d")
-    date_end = end_date.strftime("%Y-%m-%d")
+    date_start = start_date.date().isoformat()
+    date_end = end_date.date().isoformat()
     
     print(f"\nFetching articles from {date_start} to {date_end}...")
     print(f"Max articles: {args.count}")
@@ -79,8 +81,8 @@ def cmd_test_filter(args):
     end_date = datetime.now()
     start_date = end_date - timedelta(days=args.days)
     
-    date_start = start_date.strftime("%Y-%m-%d")
-    date_end = end_date.strftime("%Y-%m-%d")
+    date_start = start_date.date().isoformat()
+    date_end = end_date.date().isoformat()
     
     print(f"\nFetching articles from {date_start} to {date_end}...")
     
@@ -147,8 +149,8 @@ def cmd_test_generate(args):
         
         articles = bot_lib.fetch_articles_with_retry(
             api_key=config.EVENT_REGISTRY_API_KEY,
-            date_start=start_date.strftime("%Y-%m-%d"),
-            date_end=end_date.strftime("%Y-%m-%d"),
+            date_start=start_date.date().isoformat(),
+            date_end=end_date.date().isoformat(),
             max_articles=1
         )
         
@@ -193,8 +195,7 @@ def cmd_inspect_queue(args):
     print("=" * 80)
     
     try:
-        with open(config.QUEUE_FILE, 'r') as f:
-            queue = json.load(f)
+        queue = bot_lib.load_articles_from_json(config.QUEUE_FILE)
     except FileNotFoundError:
         print("\nQueue file not found (empty queue)")
         return 0
@@ -227,9 +228,19 @@ def cmd_inspect_posted(args):
     print("Posted Articles Inspection")
     print("=" * 80)
     
+    # Stream the log once: count entries and today's posts, and keep only
+    # the most recent args.count entries (the log is in date order)
+    today = date.today().isoformat()
+    total = 0
+    today_count = 0
+    recent = deque(maxlen=args.count)
+    
     try:
-        with open(config.POSTED_ARTICLES_FILE, 'r') as f:
-            posted = json.load(f)
+        for post in bot_lib.iter_articles_jsonl(config.POSTED_ARTICLES_FILE):
+            total += 1
+            if post.get('date', '').startswith(today):
+                today_count += 1
+            recent.append(post)
     except FileNotFoundError:
         print("\nNo posted articles file found")
         return 0
@@ -237,19 +248,14 @@ def cmd_inspect_posted(args):
         print(f"\nError reading posted articles: {e}")
         return 1
     
-    print(f"\nTotal posted: {len(posted)} articles")
-    
-    # Count by day
-    today = datetime.now().strftime("%Y-%m-%d")
-    today_count = sum(1 for p in posted if p.get('date', '').startswith(today))
-    
+    print(f"\nTotal posted: {total} articles")
     print(f"Posted today: {today_count}/{config.MAX_TWEETS_PER_DAY}")
     
-    if not posted:
+    if not recent:
         return 0
     
     print("\nRecent posts:")
-    for i, post in enumerate(sorted(posted, key=lambda x: x.get('date', ''), reverse=True)[:args.count], 1):
+    for i, post in enumerate(reversed(recent), 1):
         print(f"\n{i}. {post.get('date', 'Unknown date')}")
         print(f"   URL: {post['url']}")
         if post.get('tweet_id'):
@@ -272,8 +278,7 @@ def cmd_clear_queue(args):
             return 0
     
     try:
-        with open(config.QUEUE_FILE, 'w') as f:
-            json.dump([], f)
+        bot_lib.save_articles_to_json([], config.QUEUE_FILE)
         
         print("\n✓ Queue cleared")
         return 0
@@ -290,35 +295,19 @@ def cmd_config_check(args):
     print("=" * 80)
     
     print("\nAPI Keys:")
-    keys = {
-        'EVENT_REGISTRY_API_KEY': config.EVENT_REGISTRY_API_KEY,
-        'GEMINI_API_KEY': config.GEMINI_API_KEY,
-        'TWITTER_API_KEY': config.TWITTER_API_KEY,
-        'TWITTER_API_SECRET': config.TWITTER_API_SECRET,
-        'TWITTER_ACCESS_TOKEN': config.TWITTER_ACCESS_TOKEN,
-        'TWITTER_ACCESS_SECRET': config.TWITTER_ACCESS_SECRET,
-        'UNSPLASH_ACCESS_KEY': config.UNSPLASH_ACCESS_KEY,
-        'GITHUB_TOKEN': config.GITHUB_TOKEN
-    }
-    
-    for key, value in keys.items():
+    for key, value in config.API_KEYS.items():
         status = "✓ Set" if value else "✗ Not set"
         print(f"  {key}: {status}")
     
     print("\nWorkflow Requirements:")
-    workflows = {
-        'monitor': ['EVENT_REGISTRY_API_KEY'],
-        'post': ['GEMINI_API_KEY', 'TWITTER_API_KEY', 'TWITTER_API_SECRET', 
-                 'TWITTER_ACCESS_TOKEN', 'TWITTER_ACCESS_SECRET'],
-        'daily-brief': ['GEMINI_API_KEY', 'GITHUB_TOKEN']
-    }
-    
-    for workflow, required_keys in workflows.items():
-        missing = [k for k in required_keys if not getattr(config, k)]
-        if missing:
-            print(f"  {workflow}: ✗ Missing {missing}")
-        else:
+    for workflow in config.WORKFLOW_REQUIRED_KEYS:
+        is_valid, errors = config.validate_config(workflow)
+        if is_valid:
             print(f"  {workflow}: ✓ Ready")
+        else:
+            print(f"  {workflow}: ✗ Not ready")
+            for error in errors:
+                print(f"    - {error}")
     
     print("\nFiles:")
     files = [
@@ -328,7 +317,6 @@ def cmd_config_check(args):
         config.LOG_FILE
     ]
     
-    import os
     for filepath in files:
         exists = "✓ Exists" if os.path.exists(filepath) else "○ Not created yet"
         print(f"  {filepath}: {exists}")
@@ -401,7 +389,6 @@ def main():
         return 1
     except Exception as e:
         print(f"\n✗ Error: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 